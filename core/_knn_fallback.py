@@ -0,0 +1,48 @@
+"""
+Numba brute-force k-NN kernel used by the KDTree NumPy fallback.
+
+Importing this module requires numba; callers should treat ImportError as
+"kernel unavailable" and keep the pure NumPy path.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def knn_brute(X, Q, k, row_norms2, out_d, out_i):
+    """Fill out_d/out_i (shape (len(Q), k)) with the k nearest rows of X per query.
+
+    X and Q must be C-contiguous float32; row_norms2 holds ||x||^2 for every row
+    of X. Distances are Euclidean and sorted ascending. Requires 1 <= k <= len(X).
+    """
+    n = X.shape[0]
+    dim = X.shape[1]
+    for q in prange(Q.shape[0]):
+        qn2 = 0.0
+        for j in range(dim):
+            qn2 += Q[q, j] * Q[q, j]
+        cnt = 0
+        for r in range(n):
+            dot = 0.0
+            for j in range(dim):
+                dot += Q[q, j] * X[r, j]
+            dist = qn2 + row_norms2[r] - 2.0 * dot
+            if dist < 0.0:
+                dist = 0.0
+            if cnt < k:
+                pos = cnt
+                cnt += 1
+            elif dist < out_d[q, k - 1]:
+                pos = k - 1
+            else:
+                continue
+            # Insertion into the sorted top-k row (k is small)
+            while pos > 0 and out_d[q, pos - 1] > dist:
+                out_d[q, pos] = out_d[q, pos - 1]
+                out_i[q, pos] = out_i[q, pos - 1]
+                pos -= 1
+            out_d[q, pos] = dist
+            out_i[q, pos] = r
+        for j in range(k):
+            out_d[q, j] = np.sqrt(out_d[q, j])
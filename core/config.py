@@ -16,9 +16,13 @@ GLOBAL_SEED = int(os.getenv("E8_SEED", "42"))
 EMBED_DIM = int(os.getenv("E8_EMBED_DIM", "1536"))
 RUNTIME_DIR = os.getenv("E8_RUNTIME_DIR", "runtime")
 
-@dataclass
+@dataclass(frozen=True)
 class AppConfig:
-    """Application configuration container."""
+    """Application configuration container.
+
+    Defaults are resolved from the environment once at import; use
+    ``AppConfig.from_env()`` to get the shared immutable instance.
+    """
     global_seed: int = GLOBAL_SEED
     embed_dim: int = EMBED_DIM
     runtime_dir: str = RUNTIME_DIR
@@ -53,7 +57,9 @@ class AppConfig:
     
     @classmethod
     def from_env(cls) -> "AppConfig":
-        """Create configuration from environment variables."""
+        """Return configuration resolved from environment variables at import."""
+        if cls is AppConfig:
+            return _CACHED_CONFIG
         return cls()
     
     def log_validator_config(self, console=None):
@@ -68,3 +74,6 @@ class AppConfig:
             print(f"[VALIDATOR CONFIG] Auto-validate: {self.auto_validate_insights}")
             print(f"[VALIDATOR CONFIG] Min rating: {self.validator_min_rating}")
             print(f"[VALIDATOR CONFIG] Profile: {self.default_profile}")
+
+
+_CACHED_CONFIG = AppConfig()
@@ -7,41 +7,114 @@ including emergent seeds, task management, market data, and memory structures.
 
 import os
 import time
+import threading
 import numpy as np
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
-from collections import defaultdict
-
-# Import constants from environment
-GLOBAL_SEED = int(os.getenv("E8_SEED", "42"))
-EMBED_DIM = int(os.getenv("E8_EMBED_DIM", "1536"))
-
-# Optional imports with fallbacks
-try:
-    from sklearn.neighbors import KDTree as _SKKDTree
-except Exception:
-    _SKKDTree = None
-
-try:
-    from scipy.spatial import KDTree as _SPKDTree
-except Exception:
-    _SPKDTree = None
-
-try:
-    import faiss
-    _FAISS = True
-except Exception:
-    _FAISS = False
-
-try:
-    import networkx as nx
-    from networkx.readwrite import json_graph
-except Exception:
-    nx = None
-    class _JG:
-        def node_link_data(self, g): return {"nodes": [], "links": []}
-        def node_link_graph(self, d): return None
-    json_graph = _JG()
+from collections import defaultdict, deque
+
+# Constants resolved from the environment once in core.config
+from core.config import GLOBAL_SEED
+
+# FAISS index selection. KDTree has no incremental add and is rebuilt from scratch,
+# so the default is always flat; HNSW/IVF build far slower (HNSW ~100x at 10k) and
+# only pay off for long-lived trees. Set a threshold > 0 to opt in: HNSW from
+# E8_FAISS_HNSW_MIN_N, IVF from E8_FAISS_IVF_MIN_N vectors.
+FAISS_HNSW_MIN_N = int(os.getenv("E8_FAISS_HNSW_MIN_N", "0"))
+FAISS_IVF_MIN_N = int(os.getenv("E8_FAISS_IVF_MIN_N", "0"))
+FAISS_HNSW_M = int(os.getenv("E8_FAISS_HNSW_M", "32"))
+FAISS_EF_CONSTRUCTION = int(os.getenv("E8_FAISS_EF_CONSTRUCTION", "80"))
+FAISS_EF_SEARCH = int(os.getenv("E8_FAISS_EF_SEARCH", "64"))
+FAISS_NPROBE = int(os.getenv("E8_FAISS_NPROBE", "16"))
+# Move exhaustive search to GPU above this size when faiss reports a CUDA device
+FAISS_GPU_MIN_N = int(os.getenv("E8_FAISS_GPU_MIN_N", "50000"))
+
+# Optional heavy dependencies are imported on first use, not at module import
+# (faiss alone pulls in MKL/OpenBLAS). Each getter caches the module/class, or
+# None when unavailable; _UNSET marks "not tried yet".
+_UNSET = object()
+_faiss = _UNSET
+_sk_kdtree = _UNSET
+_sp_kdtree = _UNSET
+_knn_brute = _UNSET
+_ig = _UNSET
+_nx = _UNSET
+
+
+class _JG:
+    def node_link_data(self, g): return {"nodes": [], "links": []}
+    def node_link_graph(self, d): return None
+
+
+json_graph = _JG()
+
+
+def _get_faiss():
+    global _faiss
+    if _faiss is _UNSET:
+        try:
+            import faiss
+        except Exception:
+            faiss = None
+        _faiss = faiss
+    return _faiss
+
+
+def _get_sk_kdtree():
+    global _sk_kdtree
+    if _sk_kdtree is _UNSET:
+        try:
+            from sklearn.neighbors import KDTree as _SKKDTree
+        except Exception:
+            _SKKDTree = None
+        _sk_kdtree = _SKKDTree
+    return _sk_kdtree
+
+
+def _get_sp_kdtree():
+    global _sp_kdtree
+    if _sp_kdtree is _UNSET:
+        try:
+            from scipy.spatial import KDTree as _SPKDTree
+        except Exception:
+            _SPKDTree = None
+        _sp_kdtree = _SPKDTree
+    return _sp_kdtree
+
+
+def _get_knn_brute():
+    global _knn_brute
+    if _knn_brute is _UNSET:
+        try:
+            from core._knn_fallback import knn_brute
+        except Exception:
+            knn_brute = None
+        _knn_brute = knn_brute
+    return _knn_brute
+
+
+def _get_ig():
+    global _ig
+    if _ig is _UNSET:
+        try:
+            import igraph
+        except Exception:
+            igraph = None
+        _ig = igraph
+    return _ig
+
+
+def _get_nx():
+    global _nx, json_graph
+    if _nx is _UNSET:
+        try:
+            import networkx
+            from networkx.readwrite import json_graph as _json_graph
+            json_graph = _json_graph
+        except Exception:
+            networkx = None
+        _nx = networkx
+    return _nx
 
 
 @dataclass
@@ -92,150 +165,424 @@ class UniversalEmbeddingAdapter:
     def __init__(self, in_dim: int, out_dim: int):
         self.in_dim = in_dim
         self.out_dim = out_dim
+        self._identity = in_dim == out_dim
         
-        if in_dim == out_dim:
+        if self._identity:
             self.W = np.eye(in_dim, dtype=np.float32)
         else:
             rng = np.random.default_rng(GLOBAL_SEED)
             self.W = rng.standard_normal((in_dim, out_dim)).astype(np.float32)
             self.W /= np.linalg.norm(self.W, axis=0, keepdims=True)
+        self.W = np.ascontiguousarray(self.W, dtype=np.float32)
+        # Optional int8 weights, populated by quantize()
+        self.W_q: Optional[np.ndarray] = None
+        self.scale: Optional[np.ndarray] = None
+        self._W_q_t = None
+        self._call = self._identity_call if self._identity else self._project_call
+
+    def quantize(self) -> bool:
+        """Quantize W to int8 with per-column scales for an int8 x int8 matmul.
+
+        Dispatches through torch._int_mm (oneDNN/VNNI on CPU) and returns True when
+        that kernel is usable; otherwise leaves the float32 path in place and returns False.
+        Results are approximate (symmetric 8-bit quantization of both operands).
+        """
+        if self._identity:
+            return False
+        try:
+            import torch
+        except Exception:
+            return False
+        scale = np.max(np.abs(self.W), axis=0) / 127.0
+        scale[scale == 0] = 1.0
+        W_q = np.ascontiguousarray(np.round(self.W / scale).astype(np.int8))
+        try:
+            W_q_t = torch.from_numpy(W_q)
+            torch._int_mm(torch.zeros((1, self.in_dim), dtype=torch.int8), W_q_t)
+        except Exception:
+            return False
+        self.W_q = W_q
+        self.scale = scale.astype(np.float32)
+        self._W_q_t = W_q_t
+        self._call = self._int8_call
+        return True
+
+    def _matmul_int8(self, V: np.ndarray) -> np.ndarray:
+        """Approximate V @ W[:V.shape[-1]] via per-row int8 activations and the int8 weights."""
+        import torch
+        V2 = np.atleast_2d(V)
+        W_q_t = self._W_q_t if V2.shape[1] == self.in_dim else self._W_q_t[:V2.shape[1]]
+        v_scale = np.max(np.abs(V2), axis=1, keepdims=True) / 127.0
+        v_scale[v_scale == 0] = 1.0
+        V_q = np.round(V2 / v_scale).astype(np.int8)
+        acc = torch._int_mm(torch.from_numpy(V_q), W_q_t).numpy()
+        out = acc.astype(np.float32) * v_scale * self.scale
+        return out.reshape(V.shape[:-1] + (self.out_dim,))
 
     def __call__(self, vector: np.ndarray) -> np.ndarray:
-        """Transform a vector from input dimension to output dimension."""
-        if not isinstance(vector, np.ndarray):
-            vector = np.array(vector, dtype=np.float32)
-        
-        if vector.shape[0] != self.in_dim:
-            # Pad or truncate if there's a mismatch
-            padded_vec = np.zeros(self.in_dim, dtype=np.float32)
-            size_to_copy = min(vector.shape[0], self.in_dim)
-            padded_vec[:size_to_copy] = vector[:size_to_copy]
-            vector = padded_vec
-        
-        return vector @ self.W
+        """Transform a vector, or a (B, in_dim) batch, from input dimension to output dimension.
+
+        Inputs of a different size are zero-padded or truncated; the padding is folded
+        into the matmul by slicing W instead of building a padded copy.
+        """
+        return self._call(vector)
+
+    # Per-instance specializations of __call__, picked once in __init__/quantize()
+    def _identity_call(self, vector: np.ndarray) -> np.ndarray:
+        vector = np.asarray(vector)
+        n = vector.shape[-1]
+        if n == self.in_dim:
+            # Always a new array, like vector @ I: callers may modify it in place
+            return np.array(vector, dtype=np.float32, copy=True)
+        size_to_copy = min(n, self.in_dim)
+        out = np.zeros(vector.shape[:-1] + (self.out_dim,), dtype=np.float32)
+        out[..., :size_to_copy] = vector[..., :size_to_copy]
+        return out
+
+    def _project_call(self, vector: np.ndarray) -> np.ndarray:
+        vector = np.asarray(vector, dtype=np.float32)
+        n = vector.shape[-1]
+        if n == self.in_dim:
+            return vector @ self.W
+        # Pad or truncate if there's a mismatch: zero rows of W contribute nothing
+        size_to_copy = min(n, self.in_dim)
+        return vector[..., :size_to_copy] @ self.W[:size_to_copy]
+
+    def _int8_call(self, vector: np.ndarray) -> np.ndarray:
+        vector = np.asarray(vector, dtype=np.float32)
+        return self._matmul_int8(vector[..., :self.in_dim])
+
+
+def _normalize_rows(X: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """Write the L2-normalized rows of X into out (which may alias X).
+
+    Touches X for one einsum and one multiply; the only temporary is the (N,)
+    reciprocal-norm vector.
+    """
+    inv = np.einsum('ij,ij->i', X, X)
+    np.sqrt(inv, out=inv)
+    np.add(inv, 1e-12, out=inv)
+    np.reciprocal(inv, out=inv)
+    return np.multiply(X, inv[:, None], out=out)
+
+
+def _as_f32_contiguous(a) -> np.ndarray:
+    """Return a as a C-contiguous float32 array, without copying when it already is one."""
+    if isinstance(a, np.ndarray) and a.dtype == np.float32 and a.flags.c_contiguous:
+        return a
+    return np.ascontiguousarray(a, dtype=np.float32)
+
+
+def _faiss_num_gpus() -> int:
+    """Number of CUDA devices visible to FAISS (0 for CPU-only builds)."""
+    try:
+        return int(_get_faiss().get_num_gpus())
+    except Exception:
+        return 0
 
 
 class KDTree:
     """
     A wrapper for scikit-learn/scipy KDTree with optional FAISS and a NumPy fallback.
+
+    With FAISS, ``mmap_path`` keeps the index in a file at that path, memory-mapped
+    read-only instead of held in process memory (CPU indexes only). This is
+    opt-in: nothing in the server passes it. Rebuilding with the same path is
+    safe while an older tree still searches its mapping (the file is replaced,
+    never rewritten in place).
     """
-    def __init__(self, data):
+    def __init__(self, data, mmap_path: Optional[str] = None):
         X = np.asarray(data, dtype=np.float32)
+        # Rolling window of query latencies (ms)
+        self._latency_ms: deque = deque(maxlen=128)
         
-        if '_FAISS' in globals() and _FAISS and X.ndim == 2 and X.size:
+        faiss = _get_faiss() if X.ndim == 2 and X.size else None
+        sk_kdtree = _get_sk_kdtree() if faiss is None else None
+        sp_kdtree = _get_sp_kdtree() if faiss is None and sk_kdtree is None else None
+
+        if faiss is not None:
             self._is_faiss = True
             self._dim = X.shape[1]
-            self._faiss_index = faiss.IndexFlatIP(self._dim)
             # normalize for cosine similarity via dot
-            norms = np.linalg.norm(X, axis=1, keepdims=True) + 1e-12
-            Xn = X / norms
-            self._faiss_index.add(Xn)
+            if mmap_path:
+                # Disk-backed scratch for the normalized copy instead of a second RAM copy;
+                # named per builder so concurrent builds on one path do not share it
+                scratch = f"{mmap_path}.{os.getpid()}.{threading.get_ident()}.vecs"
+                Xn = np.memmap(scratch, dtype=np.float32, mode="w+", shape=X.shape)
+                _normalize_rows(X, Xn)
+            else:
+                Xn = _normalize_rows(X, np.empty(X.shape, dtype=np.float32))
+            # Per-thread reusable query buffers (queries may run concurrently)
+            self._q_tls = threading.local()
+            self._faiss_index = self._build_faiss_index(Xn)
+            if mmap_path:
+                del Xn
+                try:
+                    os.remove(scratch)
+                except OSError:
+                    pass
+                if getattr(self, "_gpu_res", None) is None:
+                    self._faiss_index = self._mmap_faiss_index(self._faiss_index, mmap_path)
             self.n = X.shape[0]
             self._is_fallback = False
             self._impl = None
-        elif _SKKDTree is not None:
-            self._impl = _SKKDTree(X)
+            self._search = self._search_faiss
+        elif sk_kdtree is not None:
+            self._impl = sk_kdtree(X)
             self.n = self._impl.data.shape[0]
             self._is_fallback = False
             self._is_faiss = False
-        elif _SPKDTree is not None:
-            self._impl = _SPKDTree(X)
+            self._search = self._search_tree
+        elif sp_kdtree is not None:
+            self._impl = sp_kdtree(X)
             self.n = self._impl.n
             self._is_fallback = False
             self._is_faiss = False
+            self._search = self._search_tree
         else:
+            X = np.ascontiguousarray(X).reshape(X.shape[0], -1) if X.size else X.reshape(0, 0)
             self._impl = X
+            self._X = X
+            # Cached ||x||^2 per row for the GEMM/Numba distance kernels in query_batch
+            self._row_norms2 = np.einsum('ij,ij->i', X, X).astype(np.float32)
+            self._knn_brute = _get_knn_brute()
             self.n = self._impl.shape[0]
             self._is_fallback = True
             self._is_faiss = False
-
-    def query(self, q, k: int = 1) -> Tuple[np.ndarray, np.ndarray]:
-        """Query for k nearest neighbors."""
-        t0 = time.perf_counter()
-        q_arr = np.asarray(q, dtype=np.float32)
-        is_single_query = q_arr.ndim == 1
-        q_2d = np.atleast_2d(q_arr)
-
-        if getattr(self, '_is_faiss', False):
-            q2 = q_2d
-            norms = np.linalg.norm(q2, axis=1, keepdims=True) + 1e-12
-            qn = q2 / norms
+            self._search = self._search_brute
+
+    def _build_faiss_index(self, Xn: np.ndarray):
+        """Build an inner-product FAISS index sized to the data.
+
+        Exact flat search on GPU when CUDA is available and N is large; otherwise
+        flat search, unless the opt-in HNSW/IVF thresholds are set and reached.
+        Recall/latency knobs come from E8_FAISS_EF_SEARCH and E8_FAISS_NPROBE.
+        Approximate indexes may pad results with index -1.
+        """
+        faiss = _get_faiss()
+        N, d = Xn.shape
+        if N > FAISS_GPU_MIN_N and _faiss_num_gpus() > 0:
             try:
-                qfaiss = qn.astype(np.float32)
-                if qfaiss.ndim == 1:
-                    qfaiss = qfaiss.reshape(1, -1)
-                D, I = self._faiss_index.search(qfaiss, int(k))
+                # GPU resources must outlive the index
+                self._gpu_res = faiss.StandardGpuResources()
+                index = faiss.index_cpu_to_gpu(self._gpu_res, 0, faiss.IndexFlatIP(d))
+                index.add(Xn)
+                return index
             except Exception:
-                # Fallback: no results
-                D = np.ones((q_2d.shape[0], int(k)), dtype=np.float32)
-                I = -np.ones((q_2d.shape[0], int(k)), dtype=np.int64)
-            # Convert cosine sim to distance
-            d = 1.0 - D
-            i = I
-        elif not self._is_fallback and hasattr(self._impl, 'query'):
-            d, i = self._impl.query(q_2d, k=k)
-            d = np.asarray(d, dtype=np.float32)
-            i = np.asarray(i, dtype=np.int64)
+                self._gpu_res = None
+        use_ivf = 0 < FAISS_IVF_MIN_N <= N
+        use_hnsw = not use_ivf and 0 < FAISS_HNSW_MIN_N <= N
+        if not (use_ivf or use_hnsw):
+            index = faiss.IndexFlatIP(d)
+            index.add(Xn)
+        elif use_hnsw:
+            index = faiss.IndexHNSWFlat(d, FAISS_HNSW_M, faiss.METRIC_INNER_PRODUCT)
+            index.hnsw.efConstruction = FAISS_EF_CONSTRUCTION
+            index.hnsw.efSearch = FAISS_EF_SEARCH
+            index.add(Xn)
         else:
-            # NumPy fallback for both single and batch queries
-            all_dists = []
-            all_indices = []
-            data_points = self._impl
-            
-            for query_vector in q_2d:
-                # Calculate Euclidean distances from the current query vector to all data points
-                distances = np.sqrt(np.sum((data_points - query_vector)**2, axis=1))
-                
-                # Get the indices of the k smallest distances
-                if k < self.n:
-                    # Find the k nearest indices (unsorted)
-                    nearest_idx = np.argpartition(distances, k-1)[:k]
-                    # Sort only that small partition by distance to get the correct order
-                    sorted_partition_indices = np.argsort(distances[nearest_idx])
-                    idx = nearest_idx[sorted_partition_indices]
-                else:
-                    # If k is as large as the dataset, just sort everything
-                    idx = np.argsort(distances)[:k]
-
-                all_indices.append(idx)
-                all_dists.append(distances[idx])
-            
-            d = np.array(all_dists, dtype=np.float32)
-            i = np.array(all_indices, dtype=np.int64)
+            quantizer = faiss.IndexFlatIP(d)
+            index = faiss.IndexIVFFlat(quantizer, d, int(np.sqrt(N)), faiss.METRIC_INNER_PRODUCT)
+            index.train(Xn)
+            index.add(Xn)
+            index.nprobe = FAISS_NPROBE
+        return index
+
+    def _mmap_faiss_index(self, index, path: str):
+        """Persist index to path and reopen it memory-mapped (IO_FLAG_MMAP).
+
+        The vectors/inverted lists then live in the page cache rather than the
+        heap. The index is written to a temporary file and moved over ``path``
+        with os.replace, so a previous index still mapped from ``path`` keeps its
+        (now unlinked) file intact; truncating it in place could SIGBUS in-flight
+        searches. Search knobs are reapplied after reopening; on any failure the
+        in-memory index is kept.
+        """
+        faiss = _get_faiss()
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            faiss.write_index(index, tmp)
+            os.replace(tmp, path)
+            mapped = faiss.read_index(path, faiss.IO_FLAG_MMAP)
+        except Exception as e:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            print(f"[KDTree] mmap FAISS index failed, keeping in-memory index: {e}")
+            return index
+        if hasattr(mapped, "hnsw"):
+            mapped.hnsw.efSearch = FAISS_EF_SEARCH
+        if hasattr(mapped, "nprobe"):
+            mapped.nprobe = FAISS_NPROBE
+        return mapped
+
+    def _query_buffer(self, n: int) -> np.ndarray:
+        """Return an (n, dim) float32 scratch buffer owned by the calling thread."""
+        buf = getattr(self._q_tls, 'buf', None)
+        if buf is None or buf.shape[0] < n:
+            buf = np.empty((n, self._dim), dtype=np.float32)
+            self._q_tls.buf = buf
+        return buf[:n]
+
+    def query(self, q, k: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """Query for k nearest neighbors.
+
+        Callers that look up many vectors one at a time should stack them and
+        use :meth:`query_batch` instead, which issues a single search call.
+        """
+        q_arr = _as_f32_contiguous(q)
+        d, i = self.query_batch(q_arr[None, :] if q_arr.ndim == 1 else q_arr, k)
 
         # Return results in the expected shape
-        d_out = d.ravel() if is_single_query else d
-        i_out = i.ravel() if is_single_query else i
-        
+        if q_arr.ndim == 1:
+            return d.reshape(-1), i.reshape(-1)
+        return d, i
+
+    def query_batch(self, Q, k: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """Query k nearest neighbors for every row of ``Q`` in one call.
+
+        Returns ``(D, I)`` with shape ``(N, k)`` each. Passing ``Q`` as a
+        C-contiguous float32 ``(N, dim)`` array skips every input conversion;
+        anything else is copied once into that layout.
+        """
+        t0 = time.perf_counter()
+        q_2d = _as_f32_contiguous(Q)
+        if q_2d.ndim == 1:
+            q_2d = q_2d[None, :]
+
+        d, i = self._search(q_2d, k)
+
         # Track latency rolling average
+        self._latency_ms.append((time.perf_counter() - t0) * 1000.0)
+        
+        return d, i
+
+    # Backend-specific search bodies; __init__ binds the matching one to self._search
+    def _search_faiss(self, q_2d: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        # Normalize the whole batch into a reused contiguous float32 buffer
+        qn = _normalize_rows(q_2d, self._query_buffer(q_2d.shape[0]))
         try:
-            dt_ms = (time.perf_counter() - t0) * 1000.0
-            if not hasattr(self, '_latency_ms'):
-                self._latency_ms = []
-            self._latency_ms.append(dt_ms)
-            if len(self._latency_ms) > 128:
-                self._latency_ms.pop(0)
+            D, I = self._faiss_index.search(qn, int(k))
         except Exception:
-            pass
-        
-        return d_out, i_out
+            # Fallback: no results
+            D = np.ones((q_2d.shape[0], int(k)), dtype=np.float32)
+            I = -np.ones((q_2d.shape[0], int(k)), dtype=np.int64)
+        # Convert cosine sim to distance
+        d = np.subtract(1.0, D, out=D) if D.dtype == np.float32 else (1.0 - D).astype(np.float32)
+        return d, I
+
+    def _search_tree(self, q_2d: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        d, i = self._impl.query(q_2d, k=k)
+        return np.asarray(d, dtype=np.float32), np.asarray(i, dtype=np.int64)
+
+    def _search_brute(self, q_2d: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        kk = min(int(k), self.n)
+        if self._knn_brute is not None and kk > 0:
+            # Numba kernel: distances + per-query top-k in one parallel pass
+            d = np.empty((q_2d.shape[0], kk), dtype=np.float32)
+            i = np.empty((q_2d.shape[0], kk), dtype=np.int64)
+            self._knn_brute(self._X, q_2d, kk, self._row_norms2, d, i)
+        else:
+            # NumPy fallback: squared distances for the whole batch via
+            # ||q||^2 + ||x||^2 - 2 q.x, i.e. one GEMM instead of a per-query loop
+            if self.n:
+                qn2 = np.einsum('ij,ij->i', q_2d, q_2d)
+                d2 = qn2[:, None] + self._row_norms2[None, :] - 2.0 * (q_2d @ self._X.T)
+                np.maximum(d2, 0.0, out=d2)
+            else:
+                d2 = np.zeros((q_2d.shape[0], 0), dtype=np.float32)
+
+            if kk == 0:
+                idx = np.zeros((q_2d.shape[0], 0), dtype=np.int64)
+            elif kk < self.n:
+                # Find the k nearest indices (unsorted), then sort only that partition
+                idx = np.argpartition(d2, kk - 1, axis=1)[:, :kk]
+            else:
+                idx = np.broadcast_to(np.arange(self.n), (q_2d.shape[0], self.n))
+            part = np.take_along_axis(d2, idx, axis=1)
+            order = np.argsort(part, axis=1)
+            i = np.take_along_axis(idx, order, axis=1).astype(np.int64)
+            d = np.sqrt(np.take_along_axis(part, order, axis=1)).astype(np.float32)
+        return d, i
 
 
 class GraphDB:
-    """A graph database wrapper around NetworkX for managing conceptual relationships."""
+    """A graph database wrapper around NetworkX for managing conceptual relationships.
+
+    NetworkX stays the source of truth (attributes, serialization, neighbor
+    lookups). Community detection reads a compressed sparse row (CSR) view with
+    struct-of-arrays ``indptr``/``indices``/``weights``. :meth:`to_csr` caches
+    that view until the next mutation through this class; code that edits
+    ``self.graph`` directly must call :meth:`invalidate_csr` afterwards.
+    """
     
     def __init__(self):
+        nx = _get_nx()
         if nx is None:
             raise ImportError("networkx library is required for GraphDB.")
         self.graph = nx.Graph()
+        self._version = 0  # bumped by every mutation; the CSR view is valid for one version
+        self._csr = None
+
+    def invalidate_csr(self):
+        """Mark the CSR view stale (call after mutating ``self.graph`` directly)."""
+        self._version += 1
+
+    def to_csr(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Return ``(names, indptr, indices, weights)`` for the current graph.
+
+        Row ``i`` of the adjacency (node ``names[i]``) spans
+        ``indices[indptr[i]:indptr[i+1]]``; each undirected edge is stored in
+        both rows, self-loops once. Missing weights default to 1.0.
+        """
+        version = self._version
+        if self._csr is not None and self._csr[0] == version:
+            return self._csr[1]
+
+        names = np.empty(self.graph.number_of_nodes(), dtype=object)
+        names[:] = list(self.graph.nodes())
+        index = {name: i for i, name in enumerate(names)}
+        n_edges = self.graph.number_of_edges()
+        src = np.empty(n_edges, dtype=np.int64)
+        dst = np.empty(n_edges, dtype=np.int64)
+        w = np.empty(n_edges, dtype=np.float32)
+        for e, (u, v, wt) in enumerate(self.graph.edges(data='weight', default=1.0)):
+            src[e] = index[u]
+            dst[e] = index[v]
+            w[e] = wt
+        loops = src == dst
+        rows = np.concatenate([src, dst[~loops]])
+        cols = np.concatenate([dst, src[~loops]])
+        vals = np.concatenate([w, w[~loops]])
+        order = np.argsort(rows, kind='stable')
+        indptr = np.zeros(len(names) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=len(names)), out=indptr[1:])
+        csr = (names, indptr, cols[order], vals[order])
+        self._csr = (version, csr)
+        return csr
 
     def add_node(self, node_id: str, **attrs):
         """Adds a node to the graph with the given attributes."""
         self.graph.add_node(node_id, **attrs)
+        self.invalidate_csr()
 
     def add_edge(self, source_id: str, target_id: str, **attrs):
         """Adds an edge between two nodes with the given attributes."""
         self.graph.add_edge(source_id, target_id, **attrs)
+        self.invalidate_csr()
+
+    def remove_node(self, node_id: str):
+        """Removes a node and its edges (no-op if absent)."""
+        if self.graph.has_node(node_id):
+            self.graph.remove_node(node_id)
+            self.invalidate_csr()
+
+    def remove_edge(self, source_id: str, target_id: str):
+        """Removes the edge between two nodes (no-op if absent)."""
+        if self.graph.has_edge(source_id, target_id):
+            self.graph.remove_edge(source_id, target_id)
+            self.invalidate_csr()
 
     def get_node(self, node_id: str) -> Optional[Dict[str, Any]]:
         """Retrieves a node's data."""
@@ -249,18 +596,45 @@ class GraphDB:
             return list(self.graph.neighbors(node_id))
         return []
 
-    def compute_and_store_communities(self, partition_key: str = "community_id"):
-        """Computes Louvain communities and stores the partition ID on each node."""
+    def compute_and_store_communities(self, partition_key: str = "community_id",
+                                      resolution: float = 1.0):
+        """Computes Louvain communities and stores the partition ID on each node.
+
+        Uses igraph's C implementation of Louvain (community_multilevel) when
+        python-igraph is installed, otherwise networkx. ``resolution`` > 1 favors
+        smaller communities, < 1 larger ones.
+        """
+        if self.graph.number_of_nodes() < 10:
+            return
+
+        ig = _get_ig()
+        if ig is not None:
+            try:
+                # Callers (e.g. eviction) may have edited self.graph directly
+                # without bumping the version: build from the graph as it is now
+                self.invalidate_csr()
+                names, indptr, indices, weights = self.to_csr()
+                src = np.repeat(np.arange(len(names)), np.diff(indptr))
+                once = src <= indices
+                edges = np.column_stack([src[once], indices[once]]).tolist()
+                g = ig.Graph(n=len(names), edges=edges, directed=False)
+                membership = g.community_multilevel(weights=weights[once].tolist(),
+                                                    resolution=resolution).membership
+                nodes = self.graph.nodes
+                for node_id, cid in zip(names, membership):
+                    nodes[node_id][partition_key] = cid
+                return
+            except Exception as e:
+                print(f"[GraphDB] igraph community detection failed, using networkx: {e}")
+
         try:
             from networkx.algorithms import community as nx_comm
         except Exception:
             return
             
-        if self.graph.number_of_nodes() < 10:
-            return
-            
         try:
-            communities_iter = nx_comm.louvain_communities(self.graph, seed=GLOBAL_SEED)
+            communities_iter = nx_comm.louvain_communities(self.graph, resolution=resolution,
+                                                           seed=GLOBAL_SEED)
             communities = list(communities_iter)
             for i, community_nodes in enumerate(communities):
                 for node_id in community_nodes:
@@ -282,5 +656,6 @@ class GraphDB:
                 self.graph[u][v]['weight'] = new_weight
                 for k, val in attrs.items():
                     self.graph[u][v][k] = val
+            self.invalidate_csr()
         except Exception as e:
             print(f"[GraphDB] increment_edge_weight failed: {e}")
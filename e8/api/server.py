@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import heapq
 import os
 import time
 from typing import Optional
@@ -86,19 +87,22 @@ def create_app(mind, console: Optional[object] = None):
                 pass
         return resp
 
-    connection_tracker: dict[str, float] = {}
+    # Rate limit state for ws/telemetry routes: last accepted connection per IP,
+    # plus a min-heap of (ts, ip) so stale entries are pruned in amortized O(1)
+    tracker_last: dict[str, float] = {}
+    tracker_heap: list[tuple[float, str]] = []
 
-    @web.middleware
-    async def _connection_rate_limiter(request, handler):
-        if "/ws" in request.path or "/telemetry" in request.path:
+    def _rate_limited(handler):
+        async def _connection_rate_limiter(request):
             client_ip = request.remote or "unknown"
-            now = time.time()
+            now = time.monotonic()
             # Cleanup old entries (older than 30s)
-            to_remove = [ip for ip, t in list(connection_tracker.items()) if now - t > 30]
-            for ip in to_remove:
-                connection_tracker.pop(ip, None)
+            while tracker_heap and now - tracker_heap[0][0] > 30:
+                ts, ip = heapq.heappop(tracker_heap)
+                if tracker_last.get(ip) == ts:
+                    tracker_last.pop(ip, None)
             # Simple rate limit: 1 connection/sec/IP
-            last = connection_tracker.get(client_ip)
+            last = tracker_last.get(client_ip)
             if last is not None and (now - last) < 1.0:
                 if console is not None:
                     try:
@@ -106,11 +110,13 @@ def create_app(mind, console: Optional[object] = None):
                     except Exception:
                         pass
                 return web.Response(text="Rate limited", status=429)
-            connection_tracker[client_ip] = now
-        return await handler(request)
+            tracker_last[client_ip] = now
+            heapq.heappush(tracker_heap, (now, client_ip))
+            return await handler(request)
+
+        return _connection_rate_limiter
 
     app.middlewares.append(_simple_cors_middleware)
-    app.middlewares.append(_connection_rate_limiter)
 
     app["mind"] = mind
     app["sse_clients"] = set()
@@ -139,19 +145,21 @@ def create_app(mind, console: Optional[object] = None):
     app.router.add_get("/api/memory/search", handle_memory_search)
     app.router.add_get("/api/state", handle_get_state)
     app.router.add_post("/api/action/dream", handle_trigger_dream)
-    app.router.add_get("/api/qeng/telemetry", handle_get_qeng_telemetry)
+    app.router.add_get("/api/qeng/telemetry", _rate_limited(handle_get_qeng_telemetry))
     app.router.add_get("/api/qeng/ablation", handle_get_qeng_ablation)
     app.router.add_get("/api/qeng/probabilities", handle_get_qeng_probabilities)
     app.router.add_get("/metrics/summary", handle_get_metrics_summary)
     app.router.add_get("/metrics/live", handle_get_metrics_live)
     app.router.add_post("/quantizer", handle_post_quantizer)
     app.router.add_post("/snapshot", handle_post_snapshot)
-    app.router.add_get("/api/telemetry", handle_get_telemetry)
+    app.router.add_get("/api/telemetry", _rate_limited(handle_get_telemetry))
     app.router.add_get("/api/blueprint", handle_get_blueprint)
-    app.router.add_get("/api/telemetry/stream", handle_stream_telemetry)
-    app.router.add_get("/api/telemetry/ws", handle_ws_telemetry)
-    app.router.add_get("/ws/telemetry", handle_ws_telemetry)
-    app.router.add_get("/ws", handle_ws_telemetry)
+    # Only the ws/telemetry routes pay for connection rate limiting
+    ws_telemetry = _rate_limited(handle_ws_telemetry)
+    app.router.add_get("/api/telemetry/stream", _rate_limited(handle_stream_telemetry))
+    app.router.add_get("/api/telemetry/ws", ws_telemetry)
+    app.router.add_get("/ws/telemetry", ws_telemetry)
+    app.router.add_get("/ws", ws_telemetry)
     app.router.add_get("/api/graph", handle_get_graph)
     app.router.add_get("/api/graph/summary", handle_get_graph_summary)
     app.router.add_get("/api/node/{node_id}", handle_get_node)
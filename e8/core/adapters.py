@@ -1,11 +1,27 @@
 """Lightweight adapters that re-export core types from the monolith.
 
-This allows gradual extraction without changing import sites.
+This allows gradual extraction without changing import sites. The monolith is
+imported only when a name is first used at runtime, not for type annotations.
 """
 from __future__ import annotations
 
-# Import from the monolith, renaming to short aliases for new imports.
-try:
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
     from e8_mind_server_M24 import E8Mind as Mind  # noqa: F401
-except Exception:  # pragma: no cover - keep import-safe in smoke runs
-    Mind = object  # type: ignore[assignment]
+
+
+def get_mind_cls():
+    """Return the monolith's E8Mind class (``object`` if it cannot be imported)."""
+    try:
+        from e8_mind_server_M24 import E8Mind
+    except Exception:  # pragma: no cover - keep import-safe in smoke runs
+        return object
+    return E8Mind
+
+
+def __getattr__(name):
+    # `from e8.core.adapters import Mind` keeps working, resolved lazily
+    if name == "Mind":
+        return get_mind_cls()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
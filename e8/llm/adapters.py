@@ -1,8 +1,29 @@
-"""Re-export LLM gateway helpers from the monolith for compatibility."""
+"""Re-export LLM gateway helpers from the monolith for compatibility.
+
+The monolith is imported on first runtime use, not when this module loads.
+"""
 from __future__ import annotations
 
-try:
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
     from e8_mind_server_M24 import _async_call_llm_internal as async_call_llm_internal  # noqa: F401
-except Exception:  # pragma: no cover
-    async def async_call_llm_internal(*args, **kwargs):  # type: ignore[empty-body]
-        pass
+
+
+async def _noop_async_call_llm_internal(*args, **kwargs):
+    pass
+
+
+def get_async_call_llm_internal():
+    """Return the monolith's LLM call coroutine function (a no-op if unavailable)."""
+    try:
+        from e8_mind_server_M24 import _async_call_llm_internal
+    except Exception:  # pragma: no cover
+        return _noop_async_call_llm_internal
+    return _async_call_llm_internal
+
+
+def __getattr__(name):
+    if name == "async_call_llm_internal":
+        return get_async_call_llm_internal()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,7 +1,25 @@
-"""Re-export memory types from the monolith for compatibility."""
+"""Re-export memory types from the monolith for compatibility.
+
+The monolith is imported on first runtime use, not when this module loads.
+"""
 from __future__ import annotations
 
-try:
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
     from e8_mind_server_M24 import MemoryManager as MemoryManager  # noqa: F401
-except Exception:  # pragma: no cover
-    MemoryManager = object  # type: ignore[assignment]
+
+
+def get_memory_manager_cls():
+    """Return the monolith's MemoryManager class (``object`` if it cannot be imported)."""
+    try:
+        from e8_mind_server_M24 import MemoryManager
+    except Exception:  # pragma: no cover
+        return object
+    return MemoryManager
+
+
+def __getattr__(name):
+    if name == "MemoryManager":
+        return get_memory_manager_cls()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,7 +1,25 @@
-"""Re-export scheduler types from the monolith for compatibility."""
+"""Re-export scheduler types from the monolith for compatibility.
+
+The monolith is imported on first runtime use, not when this module loads.
+"""
 from __future__ import annotations
 
-try:
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
     from e8_mind_server_M24 import CognitiveScheduler as CognitiveScheduler  # noqa: F401
-except Exception:  # pragma: no cover
-    CognitiveScheduler = object  # type: ignore[assignment]
+
+
+def get_cognitive_scheduler_cls():
+    """Return the monolith's CognitiveScheduler class (``object`` if it cannot be imported)."""
+    try:
+        from e8_mind_server_M24 import CognitiveScheduler
+    except Exception:  # pragma: no cover
+        return object
+    return CognitiveScheduler
+
+
+def __getattr__(name):
+    if name == "CognitiveScheduler":
+        return get_cognitive_scheduler_cls()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
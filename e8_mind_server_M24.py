@@ -753,7 +753,7 @@ class Manifold:
         return None
 
 # Import gather_ingest from ingest_sources
-from ingest_sources import gather_ingest
+from ingest_sources import gather_ingest, iter_ingest
 
 # Small UTC timestamp helper for metrics/telemetry
 def _now_ts():
@@ -3724,9 +3724,15 @@ except Exception:  # pragma: no cover - fallback only if modular import unavaila
 
 E8_MARKET_FEED_ENABLED = os.getenv("E8_MARKET_FEED_ENABLED", "0") == "1"
 
+@dataclass(slots=True)
 class Bar:
-    def __init__(self, **kwargs):
-        for k,v in kwargs.items(): setattr(self, k, v)
+    """One aggregated OHLCV bar as emitted by MarketFeed; ts is the bar start (epoch s)."""
+    o: float
+    h: float
+    l: float
+    c: float
+    v: float
+    ts: float
 
 class MarketFeed:
     """Connects to a real-time financial data websocket to stream tick data."""
@@ -3886,10 +3892,12 @@ def shaped_reward_components(bh, bh_ma50, action, prev_action, extras):
             from scipy.spatial import cKDTree
             tree = cKDTree(lattice_points)
             corrected_points = []
+            # One batched query for every point's neighborhood (self + 6 neighbors)
+            _, all_indices = tree.query(lattice_points, k=7)
 
             for i, point in enumerate(lattice_points):
                 # Find local neighborhood
-                distances, indices = tree.query(point, k=7)  # Include self + 6 neighbors
+                indices = all_indices[i]
 
                 if len(indices) > 1:
                     neighbors = lattice_points[indices[1:]]  # Exclude self
@@ -4037,10 +4045,11 @@ def shaped_reward_components(bh, bh_ma50, action, prev_action, extras):
             from scipy.spatial import cKDTree
             tree = cKDTree(points)
             matching_scores = []
+            _, all_indices = tree.query(points, k=7)
 
             for i, point in enumerate(points):
                 # Get local neighborhood
-                distances, indices = tree.query(point, k=7)
+                indices = all_indices[i]
 
                 if len(indices) > 1:
                     neighbors = points[indices[1:]]
@@ -4087,6 +4096,40 @@ def normalize_vector(v):
     norm = np.linalg.norm(v)
     return v / norm if norm > 1e-9 else v
 
+def unit_vector_f32(v) -> np.ndarray:
+    """Float32 copy of v scaled to unit L2 norm (near-zero vectors are left as is)."""
+    u = np.array(v, dtype=np.float32).reshape(-1)
+    norm = float(np.linalg.norm(u))
+    if norm > 1e-9:
+        u /= norm
+    return u
+
+try:  # optional SIMD distance kernels
+    import simsimd as _simsimd
+except Exception:
+    _simsimd = None
+
+try:
+    from numba import njit as _njit
+
+    @_njit(cache=True, fastmath={"reassoc", "contract"})
+    def _cosine_nb(a, b):
+        """Cosine of two equal-length 1-D arrays in one pass (float64 accumulators)."""
+        s = 0.0
+        na = 0.0
+        nb = 0.0
+        for i in range(a.shape[0]):
+            x = a[i]
+            y = b[i]
+            s += x * y
+            na += x * x
+            nb += y * y
+        if na < 1e-18 or nb < 1e-18:
+            return 0.0
+        return s / math.sqrt(na * nb)
+except Exception:
+    _cosine_nb = None
+
 class CliffordRotorGenerator:
     def __init__(self, mind_instance: 'E8Mind', layout, blades):
         self.mind = mind_instance
@@ -6934,30 +6977,85 @@ class DimensionalShell:
         except Exception:
             self.bivector_basis = []
 
+    def rotor_matrix(self, bivector_coeffs, angle) -> Optional[np.ndarray]:
+        """(dim, dim) float32 matrix of the rotor sandwich R v ~R on vector coefficients.
+
+        Column j is the vector (grade-1) part of the image of basis vector e_j, so
+        rotating every stored vector becomes one matmul. For a simple bivector the
+        image of a vector is a vector; a non-simple B (dim >= 4) can also yield
+        grade-3 parts, which this matrix discards. Coefficients that are not
+        numbers or not finite are skipped, as if zero. The last (coeffs, angle)
+        result is cached.
+        """
+        if self.vector_mode != "clifford" or not CLIFFORD_AVAILABLE:
+            return None
+        if not hasattr(self, "bivector_basis") or not self.bivector_basis:
+            self._build_bivector_basis()
+        k = min(len(self.bivector_basis), len(bivector_coeffs))
+        coeffs = []
+        for idx in range(k):
+            # One malformed coefficient drops its own term, not the whole spin
+            try:
+                c = float(bivector_coeffs[idx])
+            except (TypeError, ValueError):
+                c = 0.0
+            coeffs.append(c if math.isfinite(c) else 0.0)
+        key = (tuple(coeffs), float(angle))
+        cached = getattr(self, "_rotor_cache", None)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        B = 0
+        for c, b in zip(coeffs, self.bivector_basis):
+            if c:
+                B = B + c * b
+        Bn = B.normal() if hasattr(B, "normal") else None
+        if Bn is None or not hasattr(self.layout, "multi_vector"):
+            return None
+        R = np.cos(angle/2.0) - np.sin(angle/2.0) * Bn
+        R_rev = ~R
+        M = np.empty((self.dim, self.dim), dtype=np.float32)
+        for j, e in enumerate(self.basis_vectors):
+            img = R * e * R_rev
+            M[:, j] = [float(img[bv]) for bv in self.basis_vectors]
+        self._rotor_cache = (key, M)
+        return M
+
     def spin_with_bivector(self, bivector_coeffs, angle):
         # No-op in numpy mode or when no vectors
         if self.vector_mode != "clifford" or not CLIFFORD_AVAILABLE or not self.vectors:
             return
         try:
-            if not hasattr(self, "bivector_basis") or not self.bivector_basis:
-                self._build_bivector_basis()
-            B = 0
-            k = min(len(self.bivector_basis), len(bivector_coeffs))
-            for idx in range(k):
-                try:
-                    B = B + float(bivector_coeffs[idx]) * self.bivector_basis[idx]
-                except Exception:
-                    pass
-            Bn = B.normal() if hasattr(B, "normal") else None
-            if Bn is None or not hasattr(self.layout, "multi_vector"):
+            # Only the vector part is rotated (see rotor_matrix); other grades a
+            # stored multivector carries are kept as they were
+            M = self.rotor_matrix(bivector_coeffs, angle)
+            if M is None:
                 return
-            R = np.cos(angle/2.0) - np.sin(angle/2.0) * Bn
-            for nid in list(self.vectors.keys()):
-                try:
-                    mv = self.vectors[nid]
-                    self.vectors[nid] = R * mv * (~R) if hasattr(R, "__invert__") else mv
-                except Exception:
-                    pass
+            # Positions of e1..eN inside a multivector's coefficient array
+            idx = getattr(self, "_grade1_idx", None)
+            if idx is None:
+                idx = np.array([int(np.flatnonzero(bv.value)[0]) for bv in self.basis_vectors], dtype=np.intp)
+                self._grade1_idx = idx
+            node_ids = list(self.vectors.keys())
+            n = len(node_ids)
+            buf = getattr(self, "_spin_buf", None)
+            if buf is None or buf.shape[0] < n:
+                buf = np.empty((max(n, 64), self.dim), dtype=np.float32)
+                self._spin_buf = buf
+            X = buf[:n]
+            for i, nid in enumerate(node_ids):
+                mv = self.vectors[nid]
+                val = getattr(mv, "value", None)
+                X[i] = val[idx] if val is not None else np.asarray(mv, dtype=np.float32).reshape(-1)[:self.dim]
+            np.matmul(X, M.T, out=X)
+            for i, nid in enumerate(node_ids):
+                mv = self.vectors[nid]
+                val = getattr(mv, "value", None)
+                if val is None:
+                    self.vectors[nid] = X[i].copy()
+                    continue
+                new_val = val.copy()
+                new_val[idx] = X[i]
+                self.vectors[nid] = self.layout.MultiVector(value=new_val)
         except Exception:
             # degrade rather than crash
             self._ensure_numpy_mode()
@@ -13079,6 +13177,8 @@ class GoalField:
         self.goals: Dict[str, Dict[str, Any]] = {}
         self.is_initialized = False
         self.activation_decay = 0.98
+        # Name of the most active goal, kept current so readers skip a sort
+        self.top_goal: Optional[str] = None
 
     async def initialize_goals(self):
         if self.is_initialized: return
@@ -13096,6 +13196,7 @@ class GoalField:
             self.goals[name] = {
                 "description": desc, "embedding": vec, "activation": 0.25
             }
+        self._refresh_top_goal()
         self.is_initialized = True
         self.console.log("ðŸŒ» Goal-Field Initialized with attractors.")
 
@@ -13132,9 +13233,18 @@ class GoalField:
         if total_activation > 1e-9:
             for name in self.goals:
                 self.goals[name]["activation"] /= total_activation
+        self._refresh_top_goal()
+
+    def _refresh_top_goal(self):
+        # max() keeps the first of tied goals, matching get_top_goals' stable sort
+        if self.goals:
+            self.top_goal = max(self.goals, key=lambda name: self.goals[name]["activation"])
 
     def get_top_goals(self, k: int = 2) -> List[tuple[str, str]]:
         if not self.is_initialized: return [("nascent", "The mind is still forming its goals.")]
+        if k == 1 and self.top_goal is not None:
+            # Common single-goal query: served from the cached top goal, no sort
+            return [(self.top_goal, self.goals[self.top_goal]["description"])]
         sorted_goals = sorted(self.goals.items(), key=lambda item: -item[1]["activation"])
         return [(name, data["description"]) for name, data in sorted_goals[:k]]
 
@@ -13743,6 +13853,8 @@ class MemoryManager(GeometryHygieneMixin):
         
         self.graph_db = GraphDB()
         self.main_vectors: Dict[str, np.ndarray] = {}
+        # Unit-norm float32 view of main_vectors so cosine scoring is a bare dot product
+        self.main_vectors_unit: Dict[str, np.ndarray] = {}
         self.main_kdtree: Optional[KDTree] = None
         self._main_storage_ids: List[str] = []
         self._main_storage_matrix = np.empty((0, EMBED_DIM), dtype=np.float32)
@@ -14022,13 +14134,25 @@ class MemoryManager(GeometryHygieneMixin):
             
     @staticmethod
     def _cos_sim(v1, v2) -> float:
-        v1 = np.asarray(v1, dtype=np.float32)
-        v2 = np.asarray(v2, dtype=np.float32)
-        norm1 = np.linalg.norm(v1)
-        norm2 = np.linalg.norm(v2)
-        if norm1 < 1e-9 or norm2 < 1e-9:
+        if not (isinstance(v1, np.ndarray) and v1.dtype == np.float32):
+            v1 = np.asarray(v1, dtype=np.float32)
+        if not (isinstance(v2, np.ndarray) and v2.dtype == np.float32):
+            v2 = np.asarray(v2, dtype=np.float32)
+        if (_simsimd is not None and v1.ndim == 1 and v1.shape == v2.shape
+                and v1.flags.c_contiguous and v2.flags.c_contiguous):
+            d = float(_simsimd.cosine(v1, v2))
+            if d == 0.0 and not (v1.any() and v2.any()):
+                return 0.0  # simsimd reports distance 0 for two zero vectors
+            return 1.0 - d
+        if _cosine_nb is not None and v1.ndim == 1 and v1.shape == v2.shape:
+            # Jitted single pass: avoids three NumPy dispatches for small vectors
+            return float(_cosine_nb(v1, v2))
+        # Squared norms via vdot and a single sqrt instead of two norm() calls
+        n1 = float(np.vdot(v1, v1))
+        n2 = float(np.vdot(v2, v2))
+        if n1 < 1e-18 or n2 < 1e-18:
             return 0.0
-        return float(np.dot(v1, v2) / (norm1 * norm2))
+        return float(np.dot(v1, v2) / math.sqrt(n1 * n2))
 
     async def _try_acquire_ehs_lock(self, timeout: float = 0.1) -> bool:
         """Try to acquire EHS writer lock with timeout."""
@@ -14282,6 +14406,7 @@ class MemoryManager(GeometryHygieneMixin):
             except Exception:
                 pass
             self.main_vectors[node_id] = vec
+            self.main_vectors_unit[node_id] = unit_vector_f32(vec)
             # SDI capsule + commit logging (early path)
             try:
                 vec_bytes = np.asarray(vec, dtype=np.float32).tobytes()
@@ -14657,6 +14782,16 @@ class MemoryManager(GeometryHygieneMixin):
         except Exception:
             pass
 
+    def get_unit_vector(self, node_id: Optional[str]) -> Optional[np.ndarray]:
+        """Unit-norm float32 vector for node_id from main_vectors_unit (filled on a miss)."""
+        u = self.main_vectors_unit.get(node_id)
+        if u is None:
+            v = self.main_vectors.get(node_id)
+            if v is None:
+                return None
+            u = self.main_vectors_unit[node_id] = unit_vector_f32(v)
+        return u
+
     def find_similar_in_main_storage_e8(self, query_vector: np.ndarray, k: int = 5, decode_remnants: bool = True) -> List[tuple[str, float]]:
         """Enhanced similarity search with E8 remnant decoding for cyclic memory retrieval."""
         # Get standard similarity results first
@@ -14730,8 +14865,39 @@ class MemoryManager(GeometryHygieneMixin):
         initial_k = min(k * 5, len(ids_snapshot))
         if initial_k == 0: return []
         t0=time.perf_counter(); distances, indices = kdtree_ref.query(query_vector.reshape(1, -1), k=initial_k)
+        self._record_kdtree_latency((time.perf_counter()-t0)*1000.0)
+        distances, indices = np.atleast_1d(distances).flatten(), np.atleast_1d(indices).flatten() # Flatten results
+        return self._rerank_main_hits(query_vector, distances, indices, ids_snapshot, k)
+
+    def find_similar_batch(self, queries: np.ndarray, k: int = 5) -> List[List[tuple[str, float]]]:
+        """find_similar_in_main_storage for every row of ``queries`` with one KD-tree call.
+
+        Returns one ranked ``[(node_id, score)]`` list per query row; rows of the
+        wrong dimension (or an empty index) yield empty lists.
+        """
+        Q = np.asarray(queries, dtype=np.float32)
+        if Q.ndim != 2 or Q.shape[0] == 0:
+            return []
+        if Q.shape[1] != EMBED_DIM:
+            try:
+                self.mind.console.log(f"[MemoryManager] dimension_mismatch expected={EMBED_DIM} got={Q.shape[1]}")
+            except Exception:
+                pass
+            return [[] for _ in range(Q.shape[0])]
+        with self._index_mutex:
+            kdtree_ref = self.main_kdtree
+            ids_snapshot = list(self._main_storage_ids)
+        if kdtree_ref is None or not ids_snapshot:
+            return [[] for _ in range(Q.shape[0])]
+        initial_k = min(k * 5, len(ids_snapshot))
+        t0=time.perf_counter(); distances, indices = kdtree_ref.query(Q, k=initial_k)
+        self._record_kdtree_latency((time.perf_counter()-t0)*1000.0)
+        distances = np.asarray(distances).reshape(Q.shape[0], -1)
+        indices = np.asarray(indices).reshape(Q.shape[0], -1)
+        return [self._rerank_main_hits(Q[r], distances[r], indices[r], ids_snapshot, k) for r in range(Q.shape[0])]
+
+    def _record_kdtree_latency(self, dt_ms: float):
         try:
-            dt_ms=(time.perf_counter()-t0)*1000.0
             self._kdtree_latency_ms_window.append(dt_ms)
             try:
                 self.mind.metrics.timing('kdtree.query_ms', dt_ms)
@@ -14750,7 +14916,16 @@ class MemoryManager(GeometryHygieneMixin):
                 self._kdtree_latency_ms_window.clear()
         except Exception:
             pass
-        distances, indices = np.atleast_1d(distances).flatten(), np.atleast_1d(indices).flatten() # Flatten results
+
+    def _rerank_main_hits(self, query_vector: np.ndarray, distances: np.ndarray, indices: np.ndarray,
+                          ids_snapshot: List[str], k: int) -> List[tuple[str, float]]:
+        """Apply temperature/recency/community/potential (and VAE) reranking to raw KD-tree hits."""
+        # Approximate FAISS indexes pad missing hits with -1, which would index the last id
+        keep = indices >= 0
+        if not keep.all():
+            distances, indices = distances[keep], indices[keep]
+        if indices.size == 0:
+            return []
         query_community = (self.graph_db.get_node(ids_snapshot[indices[0]]) or {}).get("community_id", -1)
         reranked_candidates = []
         for dist, idx in zip(distances, indices):
@@ -14898,6 +15073,7 @@ class MemoryManager(GeometryHygieneMixin):
             try:
                 self.graph_db.graph.remove_node(node_id_to_evict)
                 self.main_vectors.pop(node_id_to_evict, None)
+                self.main_vectors_unit.pop(node_id_to_evict, None)
             except Exception: pass
         
         self._commit_pending_additions_locked()
@@ -15580,6 +15756,7 @@ class MemoryManager(GeometryHygieneMixin):
                 
             # Update main vectors with fully decoded version
             self.main_vectors[remnant_id] = normalize_vector(decoded_vec)
+            self.main_vectors_unit[remnant_id] = unit_vector_f32(self.main_vectors[remnant_id])
             
             # Log successful cyclic stitching
             self.console.log(f"🌀 [E8 Stitch] Remnant {remnant_id[:8]} stitched across {len(self.mind.dimensional_shells)} shells")
@@ -17846,11 +18023,15 @@ class DataIngestionPipeline:
 
     async def _process_research_ingest(self, name: str, config: Dict[str, Any]):
         max_total = config.get("max_total", 80)
-        items = await asyncio.to_thread(gather_ingest, max_total=max_total)
-        for it in items:
+        # Stream items off a worker thread so concept rating starts before the file is fully parsed
+        items = iter_ingest(max_total=max_total)
+        done = object()
+        count = 0
+        while (it := await asyncio.to_thread(next, items, done)) is not done:
             text = f"{it['title']}\n\n{it['snippet']}\n\n{it['url']}"
             await self._add_text_as_concept(text, source_name=it['source'])
-        self.console.log(f"[Ingestion] Added {len(items)} research items from '{name}'.")
+            count += 1
+        self.console.log(f"[Ingestion] Added {count} research items from '{name}'.")
 
     # New API handlers added to support pubmed_api and json_api source types
     async def _process_pubmed_api(self, name: str, config: Dict[str, Any]):
@@ -1,7 +1,7 @@
 import asyncio
 import threading
-import queue
 import time
+from collections import deque
 from dataclasses import dataclass
 from typing import Any, Dict, Callable, Tuple
 
@@ -11,7 +11,21 @@ class GeoOp:
     op: str
     args: Dict[str, Any]
     fut: asyncio.Future
+    loop: asyncio.AbstractEventLoop
     deps: Tuple[int, ...] = ()
+    # Later ops made redundant by this one before it started; their futures
+    # settle with this op's result
+    riders: Tuple["GeoOp", ...] = ()
+
+
+def _settle(fut: asyncio.Future, val, err):
+    # Runs on the future's loop; the awaiting caller may have been cancelled
+    if fut.done():
+        return
+    if err is not None:
+        fut.set_exception(err)
+    else:
+        fut.set_result(val)
 
 
 class EventHorizonScheduler:
@@ -23,7 +37,11 @@ class EventHorizonScheduler:
     """
     def __init__(self, mind, n_workers: int = 2, max_queue: int = 1024):
         self.mind = mind
-        self.q: "queue.Queue[GeoOp]" = queue.Queue(maxsize=max_queue)
+        # Plain deque guarded by one Condition: cheaper than queue.Queue, which
+        # takes its mutex plus not_empty/not_full/all_tasks_done bookkeeping per op
+        self.q: "deque[GeoOp]" = deque()
+        self._max_queue = max(1, int(max_queue or 1))
+        self._cv = threading.Condition()
         # thread-local marker used to indicate the worker thread is the authorized
         # geometry writer. Other code can check this to enforce single-writer invariants
         import threading as _threading
@@ -38,6 +56,8 @@ class EventHorizonScheduler:
             "ANNEAL_MAIN_INDEX": self._h_anneal_main_index,
             "GRAPH_MOD": self._h_graph_mod,
         }
+        # Queued, not yet started UPDATE_SHELL_INDEX op per dim (guarded by _cv)
+        self._pending_index: Dict[Any, GeoOp] = {}
         self._n_workers = max(1, int(n_workers or 1))
 
     def start(self):
@@ -49,22 +69,60 @@ class EventHorizonScheduler:
     async def submit(self, op: str, **args):
         loop = asyncio.get_running_loop()
         fut = loop.create_future()
-        # Put will block if queue full; do not block event loop
-        try:
-            self.q.put_nowait(GeoOp(op=op, args=args, fut=fut))
-        except queue.Full:
+        geo_op = GeoOp(op=op, args=args, fut=fut, loop=loop)
+        # Never block the event loop on a full queue
+        if not self._put_nowait(geo_op):
             # Backpressure: await briefly and retry once
             await asyncio.sleep(0.01)
-            try:
-                self.q.put_nowait(GeoOp(op=op, args=args, fut=fut))
-            except queue.Full:
+            if not self._put_nowait(geo_op):
                 raise RuntimeError("EventHorizonScheduler queue full")
         return await fut
 
+    @staticmethod
+    def _index_key(op: GeoOp):
+        """Shell dim of an UPDATE_SHELL_INDEX op, normalized like the handler's int(dim)."""
+        dim = op.args.get("dim")
+        try:
+            return int(dim)
+        except (TypeError, ValueError):
+            return dim  # the handler will reject it; keep it apart from valid dims
+
+    def _put_nowait(self, op: GeoOp) -> bool:
+        with self._cv:
+            key = None
+            if op.op == "UPDATE_SHELL_INDEX":
+                key = self._index_key(op)
+                prev = self._pending_index.get(key)
+                if prev is not None:
+                    # A rebuild reads the shell's state when it runs, so the one still
+                    # queued for this dim covers this request too: ride on it instead
+                    # of taking a queue slot
+                    prev.riders += (op,)
+                    return True
+            if len(self.q) >= self._max_queue:
+                return False
+            if key is not None:
+                self._pending_index[key] = op
+            self.q.append(op)
+            self._cv.notify()
+        return True
+
+    def _get(self) -> GeoOp:
+        with self._cv:
+            while not self.q:
+                self._cv.wait()
+            op = self.q.popleft()
+            if op.op == "UPDATE_SHELL_INDEX":
+                # Started: later requests for this dim must queue a fresh rebuild
+                key = self._index_key(op)
+                if self._pending_index.get(key) is op:
+                    del self._pending_index[key]
+            return op
+
     # ---------- worker & handlers ----------
     def _worker(self):
         while True:
-            op = self.q.get()
+            op = self._get()
             # mark this worker thread as the authorized geometry writer
             try:
                 self._thread_local.is_geo_writer = True
@@ -73,11 +131,11 @@ class EventHorizonScheduler:
             try:
                 fn = self._handlers.get(op.op)
                 res = fn(op.args) if fn else None
-                self._resolve(op.fut, res)
+                self._resolve(op, res)
             except Exception as e:
                 # ensure exceptions propagate back to the awaiting coroutine
                 try:
-                    self._reject(op.fut, e)
+                    self._reject(op, e)
                 except Exception:
                     pass
             finally:
@@ -87,28 +145,14 @@ class EventHorizonScheduler:
                 except Exception:
                     pass
 
-    def _resolve(self, fut, val):
-        try:
-            loop = asyncio.get_running_loop()
-        except RuntimeError:
-            # set result from non-async thread
-            asyncio.run(self._set_from_thread(fut, val))
-            return
-        loop.call_soon_threadsafe(lambda: fut.set_result(val))
-
-    def _reject(self, fut, err):
-        try:
-            loop = asyncio.get_running_loop()
-        except RuntimeError:
-            asyncio.run(self._set_exc_from_thread(fut, err))
-            return
-        loop.call_soon_threadsafe(lambda: fut.set_exception(err))
+    # Futures belong to the submitter's loop; hand results back on that loop
+    def _resolve(self, op: GeoOp, val):
+        for o in op.riders + (op,):
+            o.loop.call_soon_threadsafe(_settle, o.fut, val, None)
 
-    async def _set_from_thread(self, fut, val):
-        fut.set_result(val)
-
-    async def _set_exc_from_thread(self, fut, err):
-        fut.set_exception(err)
+    def _reject(self, op: GeoOp, err: BaseException):
+        for o in op.riders + (op,):
+            o.loop.call_soon_threadsafe(_settle, o.fut, None, err)
 
     # --- geometry operations (thread realm) ---
     def _h_add_node(self, a):
@@ -5,14 +5,63 @@ server can import `gather_ingest`. It reads `data/insights.ndjson` if
 present and returns a list of parsed JSON objects. The real project may
 replace this with a richer ingestion pipeline.
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator
 import os, json
 
+try:
+    import orjson
+    _loads = orjson.loads
+except Exception:  # orjson is optional; stdlib json also accepts bytes
+    orjson = None
+    _loads = json.loads
+
+
+def _ingest_path() -> str:
+    path = os.path.join(os.path.dirname(__file__), 'data', 'insights.ndjson')
+    # Fallback to top-level data/ if package layout places it in workspace root
+    if not os.path.exists(path):
+        path = os.path.join(os.path.dirname(__file__), '..', 'data', 'insights.ndjson')
+    return path
+
+def iter_ingest(max_total: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """Yield items for ingestion one at a time as they are parsed.
+
+    Lines are read as bytes and parsed with orjson when installed. Malformed
+    lines are skipped; read errors end the stream silently.
+
+    Args:
+        max_total: optional maximum number of items to yield.
+    """
+    path = _ingest_path()
+    limit = int(max_total) if max_total is not None else None
+    count = 0
+    try:
+        if not os.path.exists(path):
+            return
+        with open(path, 'rb') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    obj = _loads(line)
+                except Exception:
+                    # ignore malformed lines
+                    continue
+                yield obj
+                count += 1
+                if limit is not None and count >= limit:
+                    break
+    except Exception:
+        # If reading fails for any reason, stop silently.
+        return
+
 def gather_ingest(max_total: Optional[int] = None) -> List[Dict[str, Any]]:
     """Collect items for ingestion.
 
     Intended to be callable as a synchronous helper (the server sometimes
-    calls it via `asyncio.to_thread(gather_ingest, ...)`).
+    calls it via `asyncio.to_thread(gather_ingest, ...)`). Prefer
+    `iter_ingest` to start processing before the whole file is parsed.
 
     Args:
         max_total: optional maximum number of items to return.
@@ -20,31 +69,7 @@ def gather_ingest(max_total: Optional[int] = None) -> List[Dict[str, Any]]:
     Returns:
         A list of dict items (possibly empty).
     """
-    path = os.path.join(os.path.dirname(__file__), 'data', 'insights.ndjson')
-    # Fallback to top-level data/ if package layout places it in workspace root
-    if not os.path.exists(path):
-        path = os.path.join(os.path.dirname(__file__), '..', 'data', 'insights.ndjson')
-    items = []
-    try:
-        if os.path.exists(path):
-            with open(path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        obj = json.loads(line)
-                        items.append(obj)
-                        if max_total is not None and len(items) >= int(max_total):
-                            break
-                    except Exception:
-                        # ignore malformed lines
-                        continue
-    except Exception:
-        # If reading fails for any reason, return empty list silently.
-        return []
-    return items
-
+    return list(iter_ingest(max_total))
 
 if __name__ == '__main__':
     # simple standalone smoke-run
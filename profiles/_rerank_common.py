@@ -0,0 +1,260 @@
+"""Helpers shared by the profile semantics plugins.
+
+Holds the rerank switch, text and embedding normalization, and the
+goal-aware rerank that the default and science profiles both use.
+"""
+
+from __future__ import annotations
+
+import functools
+import math
+import os
+import re
+import unicodedata
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+try:  # optional SIMD cosine kernels
+    import simsimd as _simsimd
+except ImportError:
+    _simsimd = None
+
+# Set E8_RERANK=0 to return candidates in their original order, unscored
+RERANK_ENABLED = os.getenv("E8_RERANK", "1") != "0"
+_WS_RE = re.compile(r"\s+")
+
+_GOAL_HINTS = {
+    "synthesis": "Focus on unification, coherence, and underlying patterns.",
+    "novelty": "Focus on the unknown, anomalies, and breaking patterns.",
+    "stability": "Focus on core identity, reinforcement, and self-models.",
+    "curiosity": "Focus on causality, first principles, and asking 'why'."
+}
+
+
+@functools.lru_cache(maxsize=8192)
+def normalize_text(text: str) -> str:
+    """Drop soft hyphens, NFKC-normalize and collapse whitespace (memoized: labels recur)."""
+    t = text.replace("\u00AD", "")
+    if not t.isascii():  # ASCII is already NFKC-stable
+        t = unicodedata.normalize("NFKC", t)
+    return _WS_RE.sub(" ", t).strip()
+
+
+def unit_f32(vec, flatten: bool = False, eps: float = 0.0) -> np.ndarray:
+    """float32 ``vec`` scaled to unit L2 norm; left unscaled if its squared norm is <= eps.
+
+    The caller's array is never scaled in place. With ``flatten`` the result is 1-D.
+    """
+    if type(vec) is np.ndarray and vec.dtype == np.float32 and (vec.ndim == 1 or not flatten):
+        v, owned = vec, False  # backend output as-is; never scaled in place
+    else:
+        v = np.asarray(vec, dtype=np.float32)
+        if flatten:
+            v = v.reshape(-1)
+        # asarray may hand back (a view of) the caller's own buffer
+        owned = not (isinstance(vec, np.ndarray) and np.may_share_memory(v, vec))
+    n2 = float(np.vdot(v, v))
+    if n2 > eps:
+        v = np.multiply(v, 1.0 / math.sqrt(n2), out=v if owned else None)
+    return v
+
+
+class GoalAwareSemantics:
+    """Base for plugins that hint embeddings and rerank by the mind's top goal.
+
+    Subclasses call :meth:`_bind_mind` from ``attach_mind``. ``_NOVELTY_K`` is
+    the neighbour count queried per candidate in novelty rerank; the last hit
+    is the one whose distance counts.
+    """
+    __slots__ = ("mind", "_snap_fn", "_goal_field", "_memory", "_rerank_enabled", "_goal_cache")
+
+    _NOVELTY_K = 1
+
+    def __init__(self):
+        # The E8Mind instance will be attached later via attach_mind()
+        self.mind = None
+        self._snap_fn = None
+        self._goal_field = None
+        self._memory = None
+        self._rerank_enabled = False  # set once the goal field reports initialized
+        self._goal_cache = {}  # goal name -> (embedding object, unit float32 vector or None)
+
+    def _bind_mind(self, mind_instance):
+        self.mind = mind_instance
+        # Resolved once here instead of a hasattr probe per post_embed call
+        self._snap_fn = getattr(mind_instance, "_snap_to_lattice", None)
+        self._goal_field = getattr(mind_instance, "goal_field", None)
+        self._memory = getattr(mind_instance, "memory", None)
+        self._rerank_enabled = False
+        self._goal_cache = {}
+
+    def _ready_goal_field(self):
+        """The mind's goal field once it is initialized, else None.
+
+        The mind creates goal_field after attach_mind(), so the reference is
+        resolved on first use and then kept. Goal fields never revert to
+        uninitialized, so after the first success this is a single flag check.
+        """
+        if self._rerank_enabled:
+            return self._goal_field
+        gf = self._goal_field
+        if gf is None:
+            if self.mind is None:
+                return None
+            gf = self._goal_field = getattr(self.mind, "goal_field", None)
+            if gf is None:
+                return None
+        if not gf.is_initialized:
+            return None
+        self._rerank_enabled = True
+        return gf
+
+    def _unit_goal(self, goal_name: str) -> Optional[np.ndarray]:
+        """Unit float32 embedding of a goal (None if ~zero), reused while the
+        goal field still holds the same embedding object."""
+        emb = self._goal_field.goals[goal_name]['embedding']
+        hit = self._goal_cache.get(goal_name)
+        if hit is not None and hit[0] is emb:
+            return hit[1]
+        g = np.asarray(emb, dtype=np.float32).reshape(-1)
+        g_norm = np.linalg.norm(g)
+        g_unit = g / g_norm if g_norm >= 1e-9 else None
+        self._goal_cache[goal_name] = (emb, g_unit)
+        return g_unit
+
+    @staticmethod
+    def _top_goal_name(gf) -> str:
+        """Most active goal, from the field's cached top_goal when it keeps one."""
+        name = getattr(gf, "top_goal", None)
+        return name if name is not None else gf.get_top_goals(k=1)[0][0]
+
+    def pre_embed(self, text: str) -> str:
+        """🎯 Adds a goal-aware hint and normalizes text before embedding."""
+        hint = ""
+        gf = self._ready_goal_field()
+        if gf is not None:
+            try:
+                top_goal_name = self._top_goal_name(gf)
+                hint = f" | Goal hint: {_GOAL_HINTS.get(top_goal_name, '')}"
+            except (IndexError, TypeError):
+                pass
+
+        return f"{normalize_text(text or '')}{hint}"
+
+    def post_embed(self, vec, host=None, dim=None) -> np.ndarray:
+        """Normalizes and optionally snaps the vector to the E8 lattice."""
+        v = unit_f32(vec, flatten=True, eps=1e-18)
+
+        # Use the host mind instance for lattice snapping if available
+        snap = (self._snap_fn if not host or host is self.mind
+                else getattr(host, "_snap_to_lattice", None))
+        if snap is not None:
+            try:
+                v = snap(v, dim or v.size)
+            except Exception:
+                # A snap that raises does so on every call (quantizer missing on this
+                # build): stop snapping for the attached mind instead of re-raising per embed
+                if snap is self._snap_fn:
+                    self._snap_fn = None
+        return v
+
+    def rerank(self, candidates: List[Tuple[str, float]]) -> List[Tuple[str, float]]:
+        """✨ Reranks candidates based on the mind's current primary goal."""
+        # Nothing to reorder for 0/1 candidates
+        if not RERANK_ENABLED or len(candidates) <= 1:
+            return candidates
+        if not self._rerank_enabled and self._ready_goal_field() is None:
+            return candidates
+        # Memory may be bound after the goal field, so it is resolved on its own
+        if self._memory is None:
+            self._memory = getattr(self.mind, "memory", None)
+            if self._memory is None:
+                return candidates
+
+        texts = [text for text, _ in candidates]
+        scores = np.fromiter((base for _, base in candidates), dtype=np.float64,
+                             count=len(candidates))
+        texts, scores = self._rerank_soa(texts, scores)
+        return list(zip(texts, scores.tolist()))
+
+    def _rerank_soa(self, texts: List[str], scores: np.ndarray) -> Tuple[List[str], np.ndarray]:
+        """Struct-of-arrays core of rerank(): adds the goal's bonuses to ``scores`` in place
+        and returns texts and scores reordered best-first."""
+        try:
+            top_goal_name = self._top_goal_name(self._goal_field)
+        except (IndexError, TypeError):
+            return texts, scores
+
+        if top_goal_name == "novelty":
+            self._rerank_for_novelty(texts, scores)
+        else: # Synthesis (see _rerank_for_synthesis), stability, curiosity, or default
+            self._rerank_for_relevance(texts, scores, top_goal_name)
+        order = np.argsort(-scores, kind="stable")
+        return [texts[i] for i in order], scores[order]
+
+    def _rerank_for_relevance(self, texts: List[str], scores: np.ndarray, goal_name: str) -> None:
+        """Default rerank: boost candidates similar to the current goal vector.
+
+        All candidate vectors are stacked and scored against the goal with one
+        matrix-vector product rather than a cosine call per candidate.
+        """
+        g = self._unit_goal(goal_name)
+        if g is None:
+            return
+        memory = self._memory
+        get_id = memory.label_to_node_id.get
+        # Prefer the memory's cached unit vectors; raw vectors need normalizing here
+        get_unit = getattr(memory, "get_unit_vector", None)
+        get_vec = get_unit if get_unit is not None else memory.main_vectors.get
+        # Rows are written straight into one float32 matrix (no stack/astype copies)
+        M = np.empty((len(texts), g.shape[0]), dtype=np.float32)
+        for i, text in enumerate(texts):
+            v = get_vec(get_id(text))
+            # Concepts not yet in memory keep their base score (zero row -> zero similarity)
+            M[i] = 0.0 if v is None else v
+        if get_unit is None:
+            if _simsimd is not None:
+                # Raw rows: SimSIMD folds the row norms into the cosine pass
+                dist = _simsimd.cdist(M, g[None, :], metric="cosine")
+                scores += (1.0 - np.asarray(dist, dtype=np.float64).ravel()) * 0.2
+                return
+            M /= np.linalg.norm(M, axis=1, keepdims=True) + 1e-9
+        # Boost score based on relevance to the goal
+        scores += (M @ g) * 0.2
+
+    def _rerank_for_novelty(self, texts: List[str], scores: np.ndarray) -> None:
+        """Boosts candidates that are semantically different from existing memories."""
+        memory = self._memory
+        k = self._NOVELTY_K
+        # Bound once; the comprehensions below run per candidate
+        get_vec = memory.main_vectors.get
+        get_id = memory.label_to_node_id.get
+        vecs = [get_vec(get_id(text)) for text in texts]
+        present = [i for i, v in enumerate(vecs) if v is not None]
+
+        # One batched nearest-neighbour query for every candidate that has a vector
+        hits = None
+        find_batch = getattr(memory, "find_similar_batch", None)
+        if find_batch is not None and present:
+            try:
+                hits = find_batch(np.stack([vecs[i] for i in present]), k=k)
+            except ValueError:
+                hits = None  # ragged vector lengths; query one by one
+        if hits is None:
+            find_similar = memory.find_similar_in_main_storage
+            hits = [find_similar(vecs[i], k=k) for i in present]
+
+        if not present:
+            return
+        # Novelty bonus is proportional to the distance (max bonus of 0.3); no
+        # neighbour counts as infinitely far, i.e. the max bonus. fmin keeps the
+        # cap for NaN distances, like min() did.
+        nearest = np.fromiter((nodes[k - 1][1] if len(nodes) >= k else np.inf for nodes in hits),
+                              dtype=np.float64, count=len(present))
+        scores[present] += np.fmin(0.3, nearest * 0.5)
+
+    # Synthesis should boost candidates that bridge different clusters of concepts in
+    # memory, which needs community detection on the graph. Until then it is relevance,
+    # and _rerank_soa dispatches the synthesis goal to _rerank_for_relevance directly.
+    _rerank_for_synthesis = _rerank_for_relevance
@@ -1,45 +1,106 @@
 # new semantics.py
 
 from __future__ import annotations
-from typing import Mapping, List, Tuple, Any, Dict, Callable
+from typing import Mapping, Tuple, Any, Dict, Callable
 import os
-import re
-import unicodedata
-import numpy as np
-import yaml  # Added dependency: PyYAML
-
-# A helper function for cosine similarity, used in reranking.
-def _cosine_similarity(v1: np.ndarray, v2: np.ndarray) -> float:
-    """Calculates cosine similarity between two vectors."""
-    v1 = np.asarray(v1, dtype=np.float32)
-    v2 = np.asarray(v2, dtype=np.float32)
-    norm1 = np.linalg.norm(v1)
-    norm2 = np.linalg.norm(v2)
-    if norm1 < 1e-9 or norm2 < 1e-9:
-        return 0.0
-    return float(np.dot(v1, v2) / (norm1 * norm2))
+import string
+
+from profiles._rerank_common import GoalAwareSemantics
+
+# Named persona functions selectable from YAML via `persona_key`.
+def _first_persona_v1(chaotic: bool, clear: bool, calm: bool) -> str:
+    if chaotic:
+        return "You are feeling chaotic, fragmented, and electric."
+    if clear:
+        return "You are feeling exceptionally clear, logical, and focused."
+    if calm:
+        return "You are feeling calm, quiet, and introspective."
+    return "You are in a balanced and considered state of mind."
+
+# mood_v1 persona per (chaotic, clear, calm) flags; the first set flag wins.
+_MOOD_V1_PERSONAS = {(a, b, c): _first_persona_v1(a, b, c)
+                     for a in (False, True) for b in (False, True) for c in (False, True)}
+
+def _persona_mood_v1(mood: Mapping[str, float]) -> str:
+    get = mood.get  # bound once for the three lookups
+    intensity = get('intensity', 0.5)
+    return _MOOD_V1_PERSONAS[(get('entropy', 0.5) > 0.7 and intensity > 0.6,
+                              get('coherence', 0.5) > 0.75,
+                              intensity < 0.3)]
+
+PERSONA_FNS: Dict[str, Callable[[Mapping[str, float]], str]] = {
+    "default": lambda mood: "Default persona.",
+    "mood_v1": _persona_mood_v1,
+}
+
+def _compile_persona_template(template: str) -> Callable[[Mapping[str, float]], str]:
+    """Parse a persona template such as "Calm {mood[coherence]:.2f}" once.
+
+    The only variable is `mood`. Templates without fields return a constant.
+    """
+    if all(field is None for _, field, _, _ in string.Formatter().parse(template)):
+        return lambda mood: template
+    def persona(mood: Mapping[str, float]) -> str:
+        try:
+            return template.format_map({"mood": mood})
+        except (KeyError, IndexError, ValueError, TypeError):
+            return template
+    return persona
+
+def _compile_prompt_template(template: str) -> Callable[[Dict[str, Any]], str]:
+    """Tokenize a prompt template once into (literal, field, spec) parts.
+
+    Rendering joins the parts directly and raises KeyError for a missing variable,
+    like str.format. Positional fields and fields using conversions,
+    attribute/index access or nested specs fall back to str.format.
+    """
+    try:
+        parts = tuple(string.Formatter().parse(template))
+    except ValueError:
+        # Malformed template: keep failing at render time, as before
+        return lambda variables: template.format(**variables)
+    if all(field is None for _, field, _, _ in parts):
+        constant = template.replace("{{", "{").replace("}}", "}")
+        return lambda variables: constant
+    if any(field is not None and (conv or not field.isidentifier() or "{" in spec)
+           for _, field, spec, conv in parts):
+        return lambda variables: template.format(**variables)
+    def render(variables: Dict[str, Any]) -> str:
+        return "".join(lit if field is None else lit + format(variables[field], spec)
+                       for lit, field, spec, _ in parts)
+    return render
 
 class Prompts:
     """
     A simple class to load and render prompt templates from a dictionary.
     This handles the 'prompts' section of the YAML profile.
     """
+    __slots__ = ("_templates", "_compiled")
+
     def __init__(self, prompt_data: Dict[str, str]):
         self._templates = prompt_data
+        # Templates are parsed once here instead of on every render
+        self._compiled = {key: _compile_prompt_template(template)
+                          for key, template in prompt_data.items()
+                          if template and isinstance(template, str)}
 
     def render(self, key: str, **variables: Any) -> str:
         """Renders a prompt template with the given variables."""
-        template = self._templates.get(key)
-        if not template:
+        renderer = self._compiled.get(key)
+        if renderer is None:
+            template = self._templates.get(key)
+            if template:
+                # Non-string template values: let str.format's error surface as before
+                return template.format(**variables)
             # Fallback for keys not in the profile, like 'ask'
             if key == 'ask' and 'question' in variables:
                 return variables['question']
             return f"Prompt key '{key}' not found in profile."
-        
+
         # Replace placeholders like {variable} with their values
-        return template.format(**variables)
+        return renderer(variables)
 
-class DynamicScienceSemantics:
+class DynamicScienceSemantics(GoalAwareSemantics):
     """
     A dynamic semantics plugin for the E8 Mind.
 
@@ -47,26 +108,38 @@ class DynamicScienceSemantics:
     to the live mind's state to provide context-aware persona, embedding hints,
     and result reranking.
     """
+    __slots__ = ("name", "base_domain", "_persona_fn")
+
+    # k=2 to get the nearest *other* node in novelty rerank
+    _NOVELTY_K = 2
+
     def __init__(self, semantics_data: Dict[str, Any]):
-        self.mind = None  # Attached later by the E8Mind instance
+        super().__init__()
         
         # Load static configuration from the YAML data
         self.name: str = semantics_data.get("name", "unnamed_profile")
         self.base_domain: str = semantics_data.get("base_domain", "")
         
-        # The persona_prefix is a lambda function stored as a string in YAML.
-        # We use eval() to compile it into a callable Python function.
-        # This is a powerful technique for dynamic configuration.
-        persona_lambda_str = semantics_data.get("persona_prefix", "lambda mood: 'Default persona.'")
-        try:
-            self._persona_fn: Callable[[Dict], str] = eval(persona_lambda_str)
-        except Exception as e:
-            print(f"[Semantics] Failed to evaluate persona_prefix lambda: {e}")
-            self._persona_fn = lambda mood: "Default persona (eval failed)."
+        # Persona comes from a named function (`persona_key`) or a format template
+        # (`persona_prefix`); both are resolved here once, never eval'd.
+        persona_key = semantics_data.get("persona_key")
+        persona_template = semantics_data.get("persona_prefix")
+        if persona_key:
+            self._persona_fn = PERSONA_FNS.get(persona_key) or PERSONA_FNS["default"]
+            if persona_key not in PERSONA_FNS:
+                print(f"[Semantics] Unknown persona_key '{persona_key}', using default persona.")
+        elif (isinstance(persona_template, str)
+              and not persona_template.lstrip().startswith("lambda")):
+            self._persona_fn = _compile_persona_template(persona_template.strip())
+        else:
+            if persona_template:
+                print("[Semantics] persona_prefix lambdas are no longer evaluated; "
+                      "set persona_key instead.")
+            self._persona_fn = PERSONA_FNS["default"]
 
     def attach_mind(self, mind_instance):
         """Attaches the main E8Mind instance to this semantics object."""
-        self.mind = mind_instance
+        self._bind_mind(mind_instance)
         print(f"[Semantics] '{self.name}' semantics are now attached to the E8Mind instance.")
 
     def persona_prefix(self, mood_vector: Mapping[str, float]) -> str:
@@ -75,106 +148,6 @@ class DynamicScienceSemantics:
             mood_vector = {}
         return self._persona_fn(mood_vector)
 
-    def pre_embed(self, text: str) -> str:
-        """🎯 Adds a goal-aware hint and normalizes text before embedding."""
-        hint = ""
-        if self.mind and hasattr(self.mind, 'goal_field') and self.mind.goal_field.is_initialized:
-            try:
-                top_goal_name, _ = self.mind.goal_field.get_top_goals(k=1)[0]
-                goal_hints = {
-                    "synthesis": "Focus on unification, coherence, and underlying patterns.",
-                    "novelty": "Focus on the unknown, anomalies, and breaking patterns.",
-                    "stability": "Focus on core identity, reinforcement, and self-models.",
-                    "curiosity": "Focus on causality, first principles, and asking 'why'."
-                }
-                hint = f" | Goal hint: {goal_hints.get(top_goal_name, '')}"
-            except (IndexError, TypeError):
-                pass
-        
-        # Normalize text
-        t = (text or "").replace("\u00AD", "")
-        t = unicodedata.normalize("NFKC", t)
-        t = re.sub(r"\s+", " ", t).strip()
-        return f"{t}{hint}"
-
-    def post_embed(self, vec, host=None, dim=None) -> np.ndarray:
-        """Normalizes and optionally snaps the vector to the E8 lattice."""
-        v = np.asarray(vec, dtype=np.float32).reshape(-1)
-        norm = np.linalg.norm(v)
-        if norm > 1e-9:
-            v = v / norm
-        
-        mind_host = host or self.mind
-        if mind_host and hasattr(mind_host, "_snap_to_lattice"):
-            try:
-                v = mind_host._snap_to_lattice(v, dim or len(v))
-            except Exception:
-                pass
-        return v
-
-    def rerank(self, candidates: List[Tuple[str, float]]) -> List[Tuple[str, float]]:
-        """✨ Reranks candidates based on the mind's current primary goal."""
-        if not self.mind or not hasattr(self.mind, 'goal_field') or not self.mind.goal_field.is_initialized or not candidates:
-            return candidates
-
-        try:
-            top_goal_name, _ = self.mind.goal_field.get_top_goals(k=1)[0]
-        except (IndexError, TypeError):
-            return candidates
-
-        if top_goal_name == "novelty":
-            return self._rerank_for_novelty(candidates)
-        elif top_goal_name == "synthesis":
-            return self._rerank_for_synthesis(candidates)
-        else: # For stability, curiosity, or default
-            return self._rerank_for_relevance(candidates)
-
-    def _rerank_for_relevance(self, candidates: List[Tuple[str, float]]) -> List[Tuple[str, float]]:
-        """Default rerank: boost candidates similar to the current goal vector."""
-        top_goal_name, _ = self.mind.goal_field.get_top_goals(k=1)[0]
-        goal_vec = self.mind.goal_field.goals[top_goal_name]['embedding']
-        
-        scored = []
-        for text, base_score in candidates:
-            # Assumes text is the node label
-            node_id = self.mind.memory.label_to_node_id.get(text)
-            text_vec = self.mind.memory.main_vectors.get(node_id)
-            
-            if text_vec is None:
-                scored.append((text, base_score))
-                continue
-                
-            similarity = _cosine_similarity(text_vec, goal_vec)
-            final_score = base_score + (similarity * 0.2) # Boost score based on relevance
-            scored.append((text, final_score))
-            
-        return sorted(scored, key=lambda x: x[1], reverse=True)
-
-    def _rerank_for_novelty(self, candidates: List[Tuple[str, float]]) -> List[Tuple[str, float]]:
-        """Boosts candidates that are semantically different from existing memories."""
-        scored = []
-        for text, base_score in candidates:
-            node_id = self.mind.memory.label_to_node_id.get(text)
-            text_vec = self.mind.memory.main_vectors.get(node_id)
-            if text_vec is None:
-                scored.append((text, base_score))
-                continue
-
-            similar_nodes = self.mind.memory.find_similar_in_main_storage(text_vec, k=2) # k=2 to get nearest *other* node
-            if len(similar_nodes) > 1:
-                distance_to_nearest = similar_nodes[1][1]
-                novelty_bonus = min(0.3, distance_to_nearest * 0.5)
-                scored.append((text, base_score + novelty_bonus))
-            else:
-                scored.append((text, base_score + 0.3)) # Max bonus if no neighbors
-        
-        return sorted(scored, key=lambda x: x[1], reverse=True)
-
-    def _rerank_for_synthesis(self, candidates: List[Tuple[str, float]]) -> List[Tuple[str, float]]:
-        """Boosts candidates that bridge different clusters of concepts in memory."""
-        # A full implementation requires community detection. Falling back to relevance.
-        return self._rerank_for_relevance(candidates)
-
 def load_profile(name: str) -> Tuple[DynamicScienceSemantics, Prompts]:
     """
     Loads a complete profile from a YAML file, returning separate
@@ -188,8 +161,8 @@ def load_profile(name: str) -> Tuple[DynamicScienceSemantics, Prompts]:
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"Profile '{name}' not found at {file_path}")
 
-    with open(file_path, 'r', encoding='utf-8') as f:
-        profile_data = yaml.safe_load(f)
+    from profiles.loader import load_yaml_cached  # the one YAML parse cache
+    profile_data = load_yaml_cached(file_path)
         
     semantics_data = profile_data.get("semantics", {})
     prompts_data = profile_data.get("prompts", {})
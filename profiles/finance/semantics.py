@@ -1,10 +1,24 @@
 
 from typing import Mapping, List, Tuple
+import re
 import numpy as np
 
+from profiles._rerank_common import RERANK_ENABLED, unit_f32
+
 class FinanceSemantics:
+    __slots__ = ()  # all state is class-level
     name = "finance"
     base_domain = "financial markets; risk; volatility; tail events; drawdowns; liquidity; correlation; credit spreads; funding stress; term structure; skew; kurtosis"
+    _KW = [
+        "drawdown","crash","selloff","liquidity","margin","stress","cds","credit spread",
+        "funding","basis","inversion","breadth","skew","kurtosis","volatility","vix","correlation"
+    ]
+    # One alternation scanned in C; the lookahead reports every start position,
+    # so the set of matches is exactly the set of keywords present
+    _KW_RE = re.compile("(?=(" + "|".join(map(re.escape, _KW)) + "))")
+    # Same pattern over bytes: the keywords are ASCII, so rerank scans UTF-8
+    # buffers lowered with bytes.lower(), which skips the Unicode case tables
+    _KW_RE_B = re.compile(_KW_RE.pattern.encode("ascii"))
     def persona_prefix(self, mood_vector: Mapping[str, float]) -> str:
         return "You are a risk‑first markets analyst. Hunt for regime shifts and tail risk. Be precise. Be cautious. No advice."
     def pre_text(self, text: str) -> str:
@@ -14,33 +28,31 @@ class FinanceSemantics:
     def pre_embed(self, text: str) -> str:
         return text + " | terms: return, drawdown, volatility, vol-of-vol, skew, kurtosis, correlation, breadth, liquidity, credit spread, CDS, basis, term structure, VIX, funding stress"
     def post_embed(self, vec):
-        v = np.asarray(vec, dtype=np.float32)
-        n = np.linalg.norm(v)
-        return v if n == 0 else (v / n)
+        return unit_f32(vec)
     
     def rerank(self, candidates: List[Tuple[str, float]]) -> List[Tuple[str, float]]:
         """
         Boost items containing risk / crash terms. Simple keyword scoring.
         Keeps interface identical: input [(text, score)] -> output re-ordered list.
         """
-        if not candidates:
+        # Nothing to reorder for 0/1 candidates
+        if not RERANK_ENABLED or len(candidates) <= 1:
             return candidates
-        keywords = [
-            "drawdown","crash","selloff","liquidity","margin","stress","cds","credit spread",
-            "funding","basis","inversion","breadth","skew","kurtosis","volatility","vix","correlation"
-        ]
-        def boost(item):
-            text, score = item
-            t = text.lower()
-            bonus = 0.0
-            for kw in keywords:
-                if kw in t:
-                    bonus += 0.15
-            bonus = min(bonus, 0.60)
-            return (text, score + bonus)
-        boosted = [boost(it) for it in candidates]
-        boosted.sort(key=lambda x: x[1], reverse=True)
-        return boosted
+        texts = [text for text, _ in candidates]
+        scores = np.fromiter((score for _, score in candidates), dtype=np.float64,
+                             count=len(candidates))
+        texts, scores = self._rerank_soa(texts, scores)
+        return list(zip(texts, scores.tolist()))
 
+    def _rerank_soa(self, texts: List[str], scores: np.ndarray) -> Tuple[List[str], np.ndarray]:
+        """Struct-of-arrays core of rerank(): returns texts and rescored values best-first."""
+        kw_re = self._KW_RE_B
+        # Scan buffers only; the returned tuples keep the original str texts
+        hits = np.fromiter((len(set(kw_re.findall(text.encode("utf-8").lower())))
+                            for text in texts),
+                           dtype=np.float64, count=len(texts))
+        scores = scores + np.minimum(hits * 0.15, 0.60)
+        order = np.argsort(-scores, kind="stable")
+        return [texts[i] for i in order], scores[order]
 
 PLUGIN = FinanceSemantics()
@@ -1,6 +1,6 @@
 
 
-import importlib.util, os
+import copy, hashlib, importlib.util, os
 from .base_interfaces import SemanticsPlugin, PromptPack
 from typing import Mapping, List, Tuple, Any, Optional, Dict
 import logging
@@ -15,12 +15,44 @@ except ImportError:
 # Set up logger
 logger = logging.getLogger(__name__)
 
+# Executed plugin modules keyed by (path, mtime_ns), so validation, loading and
+# inheritance chains share one exec per file version
+_MOD_CACHE: Dict[Tuple[str, int], Any] = {}
+
 def _load_py(path: str):
-    spec = importlib.util.spec_from_file_location("plugin_mod", path)
+    path = os.path.abspath(path)
+    key = (path, os.stat(path).st_mtime_ns)
+    mod = _MOD_CACHE.get(key)
+    if mod is not None:
+        return mod
+    # Unique module name per file; SourceFileLoader reuses __pycache__ bytecode
+    name = "plugin_mod_" + hashlib.md5(path.encode("utf-8")).hexdigest()
+    spec = importlib.util.spec_from_file_location(name, path)
     mod = importlib.util.module_from_spec(spec)  # type: ignore
     spec.loader.exec_module(mod)  # type: ignore
+    _MOD_CACHE[key] = mod
     return mod
 
+# Parsed YAML per absolute path with the (mtime_ns, size) it was parsed at.
+# In-process only: nothing is written next to the profile files.
+_YAML_CACHE: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+
+def load_yaml_cached(path: str) -> Any:
+    """Parse a YAML file once per version (mtime and size) and return a private copy.
+
+    Parsing uses libyaml's CSafeLoader when PyYAML was built with it.
+    """
+    path = os.path.abspath(path)
+    st = os.stat(path)
+    key = (st.st_mtime_ns, st.st_size)
+    hit = _YAML_CACHE.get(path)
+    if hit is None or hit[0] != key:
+        with open(path, "r", encoding="utf-8") as f:
+            data = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+        hit = _YAML_CACHE[path] = (key, data)
+    # Callers may mutate what they get (prompt merging); keep the cached tree pristine
+    return copy.deepcopy(hit[1])
+
 class YamlPromptPack:
     def __init__(self, dct): self._d = dct or {}
     def render(self, key: str, **vars):
@@ -38,6 +70,8 @@ def clear_profile_cache():
     """Clear the profile cache. Useful for development."""
     global _profile_cache
     _profile_cache.clear()
+    _MOD_CACHE.clear()
+    _YAML_CACHE.clear()
     logger.info("Profile cache cleared")
 
 def list_available_profiles() -> List[str]:
@@ -114,6 +148,7 @@ def load_profile(profile_name: str, use_cache: bool = True, inherit_from: Option
                 raise AttributeError("Loaded semantics module missing PLUGIN or SEMANTIC_CATEGORIES definition")
 
             class _MinimalSemantics:
+                __slots__ = ("name", "base_domain", "_categories")
                 def __init__(self, name: str, categories):
                     self.name = name
                     self.base_domain = 'general'
@@ -134,8 +169,7 @@ def load_profile(profile_name: str, use_cache: bool = True, inherit_from: Option
         if os.path.exists(prm_path):
             if YAML_AVAILABLE and yaml is not None:
                 try:
-                    with open(prm_path, "r", encoding="utf-8") as f:
-                        pack_dict = yaml.safe_load(f) or {}
+                    pack_dict = load_yaml_cached(prm_path) or {}
                 except Exception as e:
                     logger.warning(f"Failed to load prompts from {prm_path}: {e}")
                     pack_dict = {}
@@ -1,8 +1,10 @@
 from __future__ import annotations
 from typing import Mapping, List, Tuple
-import os, re, unicodedata
+import os, re
 import numpy as np
 
+from profiles._rerank_common import RERANK_ENABLED, normalize_text, unit_f32
+
 class PhysicsSemantics:
     """
     Semantics plugin for physics simulation, focusing on particles, forces, and units.
@@ -11,6 +13,8 @@ class PhysicsSemantics:
     - Normalizes vectors and text for consistency.
     """
 
+    __slots__ = ()  # all state is class-level
+
     name = "physics_simulation"
     base_domain = (
         "Classical Mechanics; Newtonian Physics; Force; Mass; Acceleration; Velocity; Momentum; Energy; "
@@ -38,8 +42,27 @@ class PhysicsSemantics:
         "strong force", "weak force", "maxwell's equations", "schrodinger", "heisenberg",
         "lagrangian", "hamiltonian", "conservation", "inertia", "friction", "torque", "angular momentum"
     ]
-    _UNITS = [" m ", " kg ", " s ", " A ", " K ", " mol ", " cd ", " N ", " Pa ", " J ", " W ", " C ", " V ", " F ", " H ", " T ", " Wb ", " Hz "]
+    _UNITS = ["m", "kg", "s", "A", "K", "mol", "cd", "N", "Pa", "J", "W", "C", "V", "F", "H", "T",
+              "Wb", "Hz"]
     _SPEC = ["maybe","might","could","probably","i think","i believe","seems","appears", "hypothetically"]
+    # Single-pass alternations over the lowercased text. The _KW lookahead yields
+    # every start position, so its distinct matches are the keywords present.
+    _KW_RE = re.compile("(?=(" + "|".join(map(re.escape, _KW)) + "))")
+    _SPEC_RE = re.compile("|".join(map(re.escape, _SPEC)))
+    # Unit symbols as whole tokens, matched case-sensitively on the original text
+    # (so "kg" at end of string is found). Apostrophes count as word characters
+    # so the "s" in "it's" is not a unit. One-letter symbols collide with words
+    # ("A recipe", "C", "T") and only count right after a number: "5 A", "3N".
+    _UNITS_RE = re.compile(
+        r"(?:(?<![\w'])|(?<=\d))(?:"
+        + "|".join(re.escape(u) for u in _UNITS if len(u) > 1) + r")(?![\w'])"
+        r"|(?:(?<=\d)|(?<=\d\s))(?:"
+        + "|".join(re.escape(u) for u in _UNITS if len(u) == 1) + r")(?![\w'])"
+    )
+    _CITE_RE = re.compile(r"arxiv|doi:|https?://")
+    _EQ_RE = re.compile(r"[=∑∫∂λΩμνħ∇]|\b[FEB]\s*=")
+    # Terms that mark a candidate as on-topic even with few keyword hits
+    _ANCHOR_RE = re.compile("lagrangian|hamiltonian|maxwell|newton")
 
     def persona_prefix(self, mood_vector: Mapping[str, float]) -> str:
         # Adapt tone to mood if provided
@@ -56,10 +79,7 @@ class PhysicsSemantics:
         if not text:
             return ""
         # Remove soft hyphens and normalize unicode; collapse whitespace
-        t = text.replace("\u00AD", "")
-        t = unicodedata.normalize("NFKC", t)
-        t = re.sub(r"\s+", " ", t).strip()
-        return t
+        return normalize_text(text)
 
     def post_text(self, text: str) -> str:
         return (text or "").strip()
@@ -77,11 +97,7 @@ class PhysicsSemantics:
         """
         Normalize the vector to unit length.
         """
-        v = np.asarray(vec, dtype=np.float32).reshape(-1)
-        n = float(np.linalg.norm(v))
-        if n > 0:
-            v = v / n
-        return v
+        return unit_f32(vec, flatten=True)
 
     # ---- reranker ----
     def rerank(self, candidates: List[Tuple[str, float]]) -> List[Tuple[str, float]]:
@@ -93,42 +109,53 @@ class PhysicsSemantics:
         - Penalize off-topic if signal is weak
         Input/Output shape preserved: List[(text, score)]
         """
-        if not candidates:
+        # Nothing to reorder for 0/1 candidates
+        if not RERANK_ENABLED or len(candidates) <= 1:
             return candidates
 
-        def score_one(item: Tuple[str, float]) -> Tuple[str, float]:
-            text, base = item
-            t = (text or "").lower()
-
-            # Keyword bonus
-            kw_hits = sum(1 for w in self._KW if w in t)
-            kw_bonus = min(kw_hits * self.KW_BONUS, self.KW_MAX)
-
-            # Unit bonus
-            unit_hits = sum(1 for u in self._UNITS if u in t)
-            unit_bonus = min(unit_hits * self.UNIT_BONUS, self.KW_MAX) # Capped by the same max
+        texts = [text for text, _ in candidates]
+        base = np.fromiter((b for _, b in candidates), dtype=np.float64, count=len(candidates))
+        texts, scores = self._rerank_soa(texts, base)
+        return list(zip(texts, scores.tolist()))
 
-            # Citation bonus
-            cite_bonus = self.CITE_BONUS if ("arxiv" in t or "doi:" in t or re.search(r"https?://", t)) else 0.0
+    def _rerank_soa(self, texts: List[str], scores: np.ndarray) -> Tuple[List[str], np.ndarray]:
+        """Struct-of-arrays core of rerank(): returns texts and rescored values best-first."""
+        # Lowercase once per call; every case-insensitive scan reuses it
+        lowered = [(text or "").lower() for text in texts]
+        scores = self._score(self._hit_counts(texts, lowered), scores)
+        order = np.argsort(-scores, kind="stable")
+        return [texts[i] for i in order], scores[order]
 
-            # Speculation penalty (scaled by occurrences)
-            spec_hits = sum(t.count(w) for w in self._SPEC)
-            spec_pen = min(spec_hits * self.SPEC_PEN, 0.5)
+    def _hit_counts(self, texts: List[str], lowered: List[str]) -> np.ndarray:
+        """(N, 6) int32 matrix of per-text signals, one regex/substring pass each.
 
-            # Off-topic penalty if few keywords
-            physics_signal = kw_hits >= 2 or unit_hits >= 1 or any(k in t for k in ("lagrangian","hamiltonian","maxwell","newton"))
-            offtop_pen = 0.0 if physics_signal else self.OFFTOP_PEN
-
-            # Equations / symbols lightweight bonus
-            eq_bonus = self.EQUATION_BONUS if re.search(r"[=∑∫∂λΩμνħ∇]|\b(F|E|B)\s*=\s*", t) else 0.0
-
-            total_bonus = kw_bonus + unit_bonus + cite_bonus + eq_bonus
-            total_penalty = spec_pen + offtop_pen
-            
-            return (text, float(base + total_bonus - total_penalty))
-
-        scored = [score_one(it) for it in candidates]
-        scored.sort(key=lambda x: x[1], reverse=True)
-        return scored
+        ``lowered`` holds the lowercased ``texts``. Columns: keyword hits, unit
+        hits, speculation hits, citation flag, equation flag, anchor-term flag.
+        """
+        rows = []
+        for text, t in zip(texts, lowered):
+            rows.append((
+                len(set(self._KW_RE.findall(t))),
+                len(set(self._UNITS_RE.findall(text or ""))),
+                len(self._SPEC_RE.findall(t)),
+                self._CITE_RE.search(t) is not None,
+                self._EQ_RE.search(t) is not None,
+                self._ANCHOR_RE.search(t) is not None,
+            ))
+        return np.array(rows, dtype=np.int32).reshape(len(texts), 6)
+
+    def _score(self, counts: np.ndarray, base: np.ndarray) -> np.ndarray:
+        """Vectorized scoring over the hit-count matrix; same weights as the per-item rules."""
+        kw, unit, spec, cite, eq, anchor = counts.T
+        kw_bonus = np.minimum(kw * self.KW_BONUS, self.KW_MAX)
+        unit_bonus = np.minimum(unit * self.UNIT_BONUS, self.KW_MAX)  # Capped by the same max
+        # Speculation penalty (scaled by occurrences)
+        spec_pen = np.minimum(spec * self.SPEC_PEN, 0.5)
+        # Off-topic penalty if few keywords
+        physics_signal = (kw >= 2) | (unit >= 1) | (anchor > 0)
+        offtop_pen = np.where(physics_signal, 0.0, self.OFFTOP_PEN)
+        total_bonus = kw_bonus + unit_bonus + cite * self.CITE_BONUS + eq * self.EQUATION_BONUS
+        total_penalty = spec_pen + offtop_pen
+        return base + total_bonus - total_penalty
 
 PLUGIN = PhysicsSemantics()
\ No newline at end of file
@@ -1,7 +1,8 @@
 from typing import Mapping, List, Tuple
-import numpy as np
 import random
 
+from profiles._rerank_common import unit_f32
+
 class AdaptiveSemantics:
     """
     An adaptive semantic profile that dynamically adjusts the AI's persona and
@@ -12,6 +13,14 @@ class AdaptiveSemantics:
     base_domain = (
         "Om Padme Mani Om"
     )
+    # Constant header for pre_embed, built once with the class
+    _EMBED_PREFIX = f"Focus: {base_domain}. Text: "
+    _CURIOSITY_SUFFIXES = (" ...which raises the question.", " ...implying a deeper connection.",
+                           " ...a new avenue to explore.")
+
+    def __init__(self, seed=None):
+        # Own RNG: no shared global state, and reproducible when seeded
+        self._rng = random.Random(seed)
 
     def persona_prefix(self, mood_vector: Mapping[str, float]) -> str:
         """
@@ -25,19 +34,17 @@ class AdaptiveSemantics:
 
         # --- Dynamic Persona Selection based on Mood ---
         # Note: The keys ('curiosity', 'joy', 'tension') should match what your MoodEngine produces.
-        curiosity = mood_vector.get('curiosity', 0.0)
-        joy = mood_vector.get('joy-sadness', 0.0)
-        tension = mood_vector.get('tension', 0.0)
-
-        if curiosity > 0.7:
+        # Each key is only looked up once the earlier checks have failed.
+        get = mood_vector.get
+        if get('curiosity', 0.0) > 0.7:
             # Inquisitive and exploratory voice
             return f"{base_persona} You are currently in an inquisitive state. Focus on asking questions, identifying gaps in knowledge, and proposing new connections."
         
-        if joy > 0.6:
+        if get('joy-sadness', 0.0) > 0.6:
             # Creative and associative voice
             return f"{base_persona} You are currently in a creative state. Focus on synthesizing novel ideas, using metaphors, and exploring unconventional links between concepts."
 
-        if tension > 0.8:
+        if get('tension', 0.0) > 0.8:
             # Focused and urgent voice
             return f"{base_persona} You are currently in a state of high focus. Prioritize logical precision, data validation, and the most direct path to resolving the current goal."
 
@@ -57,21 +64,19 @@ class AdaptiveSemantics:
         
         # Add a subtle, mood-congruent concluding thought
         curiosity = mood_vector.get('curiosity', 0.0)
-        if curiosity > 0.7 and random.random() > 0.5:
-            text += random.choice([" ...which raises the question.", " ...implying a deeper connection.", " ...a new avenue to explore."])
+        if curiosity > 0.7 and self._rng.random() > 0.5:
+            text += self._rng.choice(self._CURIOSITY_SUFFIXES)
             
         return text
     
     def pre_embed(self, text: str) -> str:
         """ Prepares text for the embedding model. """
         # Adding the base domain can help ground the embeddings in the desired conceptual space.
-        return f"Focus: {self.base_domain}. Text: {text}"
+        return self._EMBED_PREFIX + str(text)
 
     def post_embed(self, vec):
         """ Normalizes the vector after embedding. A standard best practice. """
-        v = np.asarray(vec, dtype=np.float32)
-        n = np.linalg.norm(v)
-        return v if n == 0 else (v / n)
+        return unit_f32(vec)
 
     def rerank(self, candidates: List[Tuple[str, float]]) -> List[Tuple[str, float]]:
         """ A neutral pass-through rerank. Could be upgraded further if needed. """